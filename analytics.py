@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vectorized analytics for the Data Analysis page.
+
+Every function works on any number of tickers in a single groupby pass, so the
+same code serves the 5 airlines and the whole S&P 500 universe.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def select_symbols(securities, symbols=None, sub_industry=None):
+    """Tickers given explicitly, or every ticker of a `gics_sub_industry`."""
+    if symbols is not None:
+        return list(symbols)
+    if sub_industry is None:
+        return securities['ticker_symbol'].tolist()
+    return securities.loc[securities['gics_sub_industry'] == sub_industry, 'ticker_symbol'].tolist()
+
+
+def close_statistics(prices, symbols=None, start=None, end=None):
+    """
+    Per-symbol closing price statistics over the [start, end] date window.
+
+    Returns a frame indexed by symbol with the number of trading days, mean,
+    sample standard deviation (volatility), first and last close, and the
+    trend price ((last - first) / first).
+    """
+    mask = np.ones(len(prices), dtype=bool)
+    if symbols is not None:
+        mask &= prices['symbol'].isin(symbols).to_numpy()
+    if start is not None:
+        mask &= (prices['date'] >= pd.Timestamp(start)).to_numpy()
+    if end is not None:
+        mask &= (prices['date'] <= pd.Timestamp(end)).to_numpy()
+    window = prices.loc[mask, ['symbol', 'date', 'close']].sort_values(['symbol', 'date'], kind='mergesort')
+
+    close = window['close'].astype('float64')
+    stats = close.groupby(window['symbol'], observed=True).agg(['count', 'mean', 'std', 'first', 'last'])
+    stats.columns = ['count', 'mean', 'standard_deviation', 'first_close', 'last_close']
+    stats.index = stats.index.astype(str)
+    stats['trend_price'] = (stats['last_close'] - stats['first_close']) / stats['first_close']
+    stats.index.name = 'ticker_symbol'
+    if symbols is not None:
+        stats = stats.reindex([symbol for symbol in symbols if symbol in stats.index])
+    return stats
+
+
+def benchmark_trend_price(stats, benchmark=None):
+    """
+    Trend price of an equally weighted group of stocks.
+
+    `benchmark` is a list of symbols from `stats`; by default the whole set is
+    used, i.e. the stocks are compared against their own peer group.
+    """
+    group = stats if benchmark is None else stats.loc[list(benchmark)]
+    initial = group['first_close'].mean()
+    end = group['last_close'].mean()
+    return (end - initial) / initial
+
+
+def relative_price_strength(stats, benchmark=None):
+    """Trend price of each stock divided by the trend price of the benchmark group."""
+    return stats['trend_price'] / benchmark_trend_price(stats, benchmark)
+
+
+LIQUIDITY_RATIOS = ['cash_ratio', 'current_ratio', 'quick_ratio', 'operating_cash_flow_ratio']
+INDUSTRY_KEY = ['gics_sub_industry', 'period_ending']
+
+
+def liquidity_ratios(combined):
+    """
+    Liquidity ratios per filing of `combined` (fundamentals merged with securities).
+
+    `cash_ratio` is the value reported in fundamentals.csv; the current, quick
+    and operating cash flow ratios are derived from the balance sheet and cash
+    flow columns. Each ratio also gets the average of the filing's
+    `gics_sub_industry` for the same `period_ending`.
+    """
+    ratios = combined[['ticker_symbol', 'period_ending', 'security', 'gics_sector', 'gics_sub_industry',
+                       'cash_ratio', 'total_current_assets', 'total_current_liabilities',
+                       'inventory', 'net_cash_flow_operating']].copy()
+    liabilities = ratios['total_current_liabilities'].replace(0, np.nan)
+    ratios['current_ratio'] = ratios['total_current_assets'] / liabilities
+    ratios['quick_ratio'] = (ratios['total_current_assets'] - ratios['inventory']) / liabilities
+    ratios['operating_cash_flow_ratio'] = ratios['net_cash_flow_operating'] / liabilities
+    return add_industry_averages(ratios)
+
+
+def add_industry_averages(ratios, rows=None):
+    """(Re)compute the `<ratio>_industry_average` columns, optionally only for a boolean mask of rows."""
+    subset = ratios if rows is None else ratios[rows]
+    industry = subset.groupby(INDUSTRY_KEY)
+    for ratio in LIQUIDITY_RATIOS:
+        ratios.loc[subset.index, f'{ratio}_industry_average'] = industry[ratio].transform('mean')
+    return ratios
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Page registry for the navigation pane.
+
+Each page lives in its own module with a `render()` function. A module is only
+imported when its page is selected, so text-only pages never pay for pandas,
+plotly or the datasets, and the data pages only load what they use.
+"""
+
+import importlib
+
+from profiling import stage
+
+# (menu title, bootstrap icon, module)
+PAGES = [
+    ('Abstract', 'bookmark-check', 'app_pages.abstract'),
+    ('Background Information', 'book', 'app_pages.background'),
+    ('Data Cleaning', 'file-check', 'app_pages.data_cleaning'),
+    ('Data Analysis', 'map', 'app_pages.data_analysis'),
+    ('Conclusion', 'boxes', 'app_pages.conclusion'),
+    ('Bibliography', 'bookmarks', 'app_pages.bibliography'),
+]
+
+TITLES = [title for title, _, _ in PAGES]
+ICONS = [icon for _, icon, _ in PAGES]
+MODULES = {title: module for title, _, module in PAGES}
+
+
+def render(title):
+    with stage(f'import {MODULES[title]}'):
+        module = importlib.import_module(MODULES[title])
+    with stage(f'render {title}'):
+        module.render()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Background Information page: stock trading primer and the raw datasets."""
+
+import streamlit as st
+
+from data_loader import load_fundamentals, load_prices, load_securities
+from tables import paginated_table
+
+
+def render():
+    fundamentals = load_fundamentals()
+    prices = load_prices()
+    securities = load_securities()
+
+    st.title('Background Information')
+    st.header('What is Stock Trading?')
+    st.caption('The following is extraced from Investopedia, a financial media website that is founded in 1999, and headquartered in New York City. Source: https://www.investopedia.com/articles/investing/082614/how-stock-market-works.asp')
+    st.markdown('A stock is a financial instrument that represents ownership in a company or corporation and represents a proportionate claim on its assets (what it owns) and earnings (what it generates in profits). Stocks are also called shares or equity.')
+    st.markdown('Owning stock means that a shareholder owns a slice of the company equal to the number of shares held as a proportion of the company\'s total outstanding shares. For instance, an individual or entity that owns 100,000 shares of a company with one million outstanding shares would have a 10% ownership stake in it. Most companies have outstanding shares that run into the millions or billions.')
+    st.header('Key Takeaways')
+    st.markdown('- Stocks represent ownership equity in the firm and give shareholders voting rights as well as a residual claim on corporate earnings in the form of capital gains and dividends.')          
+    st.markdown('- Individual and institutional investors come together on stock exchanges to buy and sell shares in a public venue.')
+    st.markdown('- Share prices are set by supply and demand as buyers and sellers place orders.')
+    st.markdown('- Order flow and bid-ask spreads are often maintained by specialists or market makers to ensure an orderly and fair market.')
+    st.markdown('- Listing on exchanges may provide companies with liquidity and the ability to raise capital but it can also mean higher costs and increased regulation.')
+          
+    
+    st.header('Original Datasets')
+    st.subheader('Context')
+    st.markdown('The three datasets that is going to be analyzed in this stock market case study is: \'fundamentals.csv\', \'prices.csv\', and \'securities.csv\', which are all collected from https://www.kaggle.com/datasets/dgawlik/nyse. Furthermore, the datasets as mentioned previously consists of fundamental data of the S&P 500 companies, along with their historical prices on the stock market.')
+    st.markdown('Specifically, the \'prices.csv\' dataset mainly consists of daily trading information spanning from 2010 - 2016 for the majority of the firms, as shown below:')
+    st.caption('Click on the expand key to zoom in')
+    paginated_table(prices, key='prices')
+    
+    st.markdown('On the other hand, the \'fundamentals.csv\' dataset consists of metrics extracted from the annual SEC 10k fillings(2012-2016), which is adequate to perform analysis on key investment indicators(e.g current ratio). Subsequently, the \'securities.csv\' dataset is supplementry to the \'fundamentals.csv\' dataset, consisting of qualitative data(general descriptions of each company, e.g industry).')
+    st.markdown('\'fundamentals.csv\'')
+    st.caption('Click on the expand key to zoom in')
+    paginated_table(fundamentals, key='fundamentals')
+    st.markdown('\securities.csv\'')
+    st.caption('Click on the expand key to zoom in')
+    paginated_table(securities, key='securities')
+ 
+    st.markdown('')
+    st.header('Columns to be Used')
+    st.markdown('date: the date in the format year-month-date which the stock was traded.')
+    st.markdown('symbol: unique series of letters assigned to stocks for trading purposes.')
+    st.markdown('open: the opening price of the stock for the corresponding date in the \'date\' column.')
+    st.markdown('close: the closing price of the stock for the corresponding date in the \'date\' column.')
+    st.markdown('low: the lowest trading price of the stock for the corresponding date in the \'date\' column.')
+    st.markdown('high: the highest trading price of the stock for the corresponding date in the \'date\' column.')
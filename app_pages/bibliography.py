@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Bibliography page: text only."""
+
+import streamlit as st
+
+
+def render():
+    st.title('Bibliography')
+    st.header('Original Datasets')
+    st.markdown('Gawlik, D. (2017, February 22). New York Stock Exchange. Kaggle. Retrieved September 17, 2022, from https://www.kaggle.com/datasets/dgawlik/nyse ')
+    st.header('Other Resources')
+    st.markdown('Fernando, J. (2022, August 23). Current ratio explained with formula and examples. Investopedia. Retrieved August 23, 2022, from https://www.investopedia.com/terms/c/currentratio.asp')
+    st.markdown('Hayes, A. (2022, September 13). Volatility: Meaning in finance and how it works with stocks. Investopedia. Retrieved August 19, 2022, from https://www.investopedia.com/terms/v/volatility.asp')
+    st.markdown('Hayes, A. (2022, June 22). A breakdown on how the Stock Market Works. Investopedia. Retrieved September 14, 2022, from https://www.investopedia.com/articles/investing/082614/how-stock-market-works.asp ')
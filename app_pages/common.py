@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Datasets shared by the Data Cleaning and Data Analysis pages."""
+
+from functools import lru_cache
+
+from analytics import select_symbols
+from data_loader import data_version, load_combined, load_price_store
+from profiling import stage
+
+
+def airline_datasets():
+    """
+    The 2015 airline filings, their ticker symbols, the price store and the
+    airlines' 2010-2015 prices.
+
+    The same objects are returned on every rerun until the data changes, so
+    treat them as read-only.
+    """
+    return _airline_datasets_cached(data_version())
+
+
+@lru_cache(maxsize=1)
+def _airline_datasets_cached(version):
+    combined = load_combined()
+    with stage('filter airline filings') as current:
+        combined = combined[combined['period_ending'] == '2015-12-31']
+        airlines = combined[combined['gics_sub_industry'] == 'Airlines'].copy()
+        airlines_2015 = current.record(airlines[airlines['period_ending'] == '2015-12-31'])
+        airline_symbols = select_symbols(combined, sub_industry='Airlines')
+
+    # Prices sorted by (symbol, date), so each airline's 2010-2015 window is a
+    # positional slice rather than a mask over the whole table
+    price_store = load_price_store()
+    with stage('airline price window') as current:
+        all_prices = current.record(price_store.window(airline_symbols, end='2015-12-31'))
+    all_prices.rename(columns={'low':'low (USD)', 'high':'high (USD)'})
+    return airlines_2015, airline_symbols, price_store, all_prices
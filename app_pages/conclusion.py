@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Conclusion page, with a Lottie animation fetched from lottiefiles.com."""
+
+import requests
+import streamlit as st
+from streamlit_lottie import st_lottie
+
+from profiling import stage
+
+
+def render():
+     st.title('Conclusion')
+     def load_lottieurl(url: str):
+        with stage('lottie fetch') as current:
+            r = requests.get(url)
+            current.note(status=r.status_code, bytes=len(r.content))
+        if r.status_code != 200:
+            return None
+        return r.json()
+     lottie_coding = load_lottieurl("https://assets6.lottiefiles.com/packages/lf20_qp1q7mct.json")
+     st_lottie(
+		lottie_coding,
+		speed=1,
+		reverse=False,
+		loop=True,
+		quality="low", # medium ; high
+		height=None,
+		width=600,
+		key=None,
+		)
+	
+     st.markdown('In terms of financial performance, American Airline Group Inc.(with ticker symbol AAL) ranks top in both our cash ratio and current ratio analysis by a decent margin, with 74 and 0.92 respectively, indicating the firm\'s relatively outstanding ability in terms of liquidity in the airline industry, which could be potentially an indicator for sustained high performances in the stock market. While in terms of return on investment, over 2010-2015 AAL\'s stock outperformed its peer group by the widest margin, with a relative price strength of 2.961872 (outperforming the airline industry by 1.961872), whereas ALK, with a relative price strength of 0.492064, underperformed it. In terms of volatility, LUV pertains the lowest standard deviation of its stock prices (12.168415) and ALK the highest (16.078078).')
+     st.markdown('Therefore, American Airline Group Inc. would be our top airline stock to invest in the S&P 500 index in the year 2016.')
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Data Analysis page: liquidity ratios, volatility and relative price strength."""
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics import relative_price_strength
+from app_pages.common import airline_datasets
+from charts import close_matrix, time_series_figure, wide_matrix
+from cross_section import load_cross_section
+from data_loader import industry_ratios
+from figure_cache import figure_cache
+from price_store import ROLLING_WINDOWS
+from profiling import stage
+from tables import paginated_table
+
+TOO_FEW_DAYS = 'There are not enough trading days in this date range to compare the airlines on this measure; widen the range with the slider above.'
+
+
+def render():
+    _, airline_symbols, price_store, all_prices = airline_datasets()
+
+    st.title('Data Analysis')
+    st.header('Financial Performance')
+    st.subheader('Factor 1: Cash Ratio')
+    st.markdown('According to Investopia: \"(A high cash ratio)This means a company has more cash on hand, lower short-term liabilities, or a combination of the two. It also means a company will have greater ability to pay off current debts as they come due.\" Resultingly, a firm\'s performance and it\'s cash ratio stands in a positive relationship. In other words, the two variables(\'a firm\'s performance\' and \'the firm\'s cash ratio\') increases or decreases simultaneously. Because of this, we\'d like to invest in companies with high cash ratios.')
+    col1,col2 = st.columns([4,5])
+    col1.subheader('Bar Plot Comparison by Industry')
+    roption=col1.selectbox('Select the industry you would like to evaluate',
+                           ('Airlines', 'Telecommunications Equipment', 'Casinos & Gaming', 'Financial Exchanges & Data', 'Gold', 'Oil & Gas Drilling'))
+
+    def build_cash_ratio_bar():
+        return px.bar(industry_ratios(roption, '2015-12-31'), x='ticker_symbol', y='cash_ratio', color='ticker_symbol')
+    col2.plotly_chart(figure_cache.figure('Data Analysis', 'cash_ratio_bar', {'industry': roption}, build_cash_ratio_bar))
+    col1.markdown('As depicted from the graph above, the airline firms \'ALK\' and \'AAL\' would be our top 2 stock investments with the highest cash ratios out of the 5 airline stocks in our merged dataset, with cash ratios of 74 and 51 respectively.')
+    
+    
+    st.subheader('Factor 2: Current Ratio')
+    st.markdown('According to Investopedia, \"The current ratio is a liquidity ratio that measures a company\’s ability to pay short-term obligations or those due within one year. It tells investors and analysts how a company can maximize the current assets on its balance sheet to satisfy its current debt and other payables. A current ratio that is in line with the industry average or slightly higher is generally considered acceptable. A current ratio that is lower than the industry average may indicate a higher risk of distress or default. Similarly, if a company has a very high current ratio compared with its peer group, it indicates that management may not be using its assets efficiently.\"')
+    
+    def build_current_ratio_bar():
+        airlines_2015 = industry_ratios('Airlines', '2015-12-31')
+        current_ratio_bar = px.bar(airlines_2015, x='ticker_symbol', y='current_ratio', title='Current Ratio', 
+                               hover_data=['total_current_assets', 'total_current_liabilities'], 
+                               color='ticker_symbol', text_auto=True, 
+                               labels={'current_ratio':'Current Ratio', 'ticker_symbol':'Ticker Symbol'},
+                           
+                                )
+        current_ratio_bar.update_layout(title_font_size=25, title_x=0.5, xaxis = dict(
+        tickfont = dict(size=15)))
+        current_ratio_bar.update_traces(textfont_size=15, textposition='inside', textfont_color='black',
+                                    texttemplate='<b>%{y:.2f}</b>', 
+                                    hovertemplate='''Ticker Symbol: %{x} <br>Current Ratio: %{y:.4f}
+                                    <br>Total Current Assets: %{customdata[0]:$,}<br>Total Current Liabilities: %{customdata[1]:$,}'''
+                                   )
+
+        # Setting the benchmark of the bar plot as the industry average as calculated above
+        current_ratio_bar.add_traces(go.Scatter(x=airlines_2015['ticker_symbol'], y=airlines_2015['current_ratio_industry_average'], mode = 'lines',
+                                            name='Industry Average',
+                                           line_color='black', line_width=4
+                                        ))
+        current_ratio_bar.update_yaxes(range=(0,1), showgrid=False)
+        current_ratio_bar.update_xaxes(showgrid=False)
+        return current_ratio_bar
+
+    current_ratio_bar = figure_cache.figure('Data Analysis', 'current_ratio_bar', {}, build_current_ratio_bar)
+    st.plotly_chart(current_ratio_bar)
+    st.markdown('As shown from the \'Current Ratio\' bar graph above, all airline firms in the U.S stock market pertains a current ratio below 1, indicating the lack of liquid assets to pay off short-term(within 1 year in this case) debts for all firms in the airline industry. Specifically, companies AAL and UAL are slightly higher/lower(within 0.1) than the average current ratio for firms in the airline industry: 0.66907, which is considered an acceptable performance relative to its competitor. While the firms DAL and LUV are lower than the average current ratio for firms in the airline industry, with a current ratio of 0.516718 and 0.5433432 respectively, indicating that at the current stage, the firm is unable to pay off nearly half of its short term debts. On the other hand, Alaska Air Group, Inc.(ALK) are higher than the average current ratio for firms in the airline industry, suggesting the company\'s high capability of paying off short term obligations relative to the performance of firms in the airline industry; On the other hand, the high current ratio of ALK relative to the average current ratio of the airline industry may indicate the underutilization of resources by the firm\'s management team. ')
+    st.markdown('As a recap, our purpose in calculating the current ratio is to determine for the investors the top airline stocks to invest in the U.S stock market which is the least likely to experience bankrupcy relative to its peer group. In this case, although Alaska Air Group, Inc. (ALK) may be using its resources inefficiently, it is still ranked 1st in terms of current ratio out of its competitors, which in other words, in the short term the firm is least likely to experience bankrupcy due to its relatively high asset and debt ratio in the airline industry.')
+    
+    st.header('Return on Investment')
+    if all_prices.empty:
+        st.info('No 2010-2015 closing prices of the airline stocks were loaded, so the return on investment analysis is skipped.')
+        return
+    st.subheader('Factor 1: Volatility(Standard Deviation) of Stock Prices')
+    st.markdown('The standard deviation of stock prices is a vital piece of information regarding its volatility and the extent of investment risk for stock investors. Specifically, standard deviations measures the dispersion of a dataset(the closing prices of stocks in this case) around the mean. Furthermore, the standard deviation is derived through square rooting the variance, which is calculated by summing the squared difference between each data point and the mean of the dataset, then divided by the number of datapoints subtracted by one. Since we\'re squaring the difference between each data point and the mean, the standard deviation for each stock can be deduced of being "double-sided": on one side the standard deviation could represent the stock\'s potential to rise in terms of price, while on the other hand, this measurement of volatility could indicate the stock\'s potential to drop in its prices. Therefore in order to guarentee a positive return rate of the investment in airline stocks, we must select a firm that is the lowest in the standard deviation of its stock prices as relative to its competitors.')
+    st.markdown('To make the data presentation easier to comprehend, we will first visualize the trends/changes of each airline stock\'s daily closing prices during the 2010-2015 time period.')
+    
+    # One wide date x ticker frame, downsampled to the chart width and drawn with
+    # WebGL; narrowing the date range re-samples that window at full resolution
+    first_date, last_date = all_prices['date'].min().date(), all_prices['date'].max().date()
+    zoom_start, zoom_end = st.slider('Date range (applies to every chart in this section)', min_value=first_date,
+                                     max_value=last_date, value=(first_date, last_date), format='YYYY-MM-DD')
+    window_widgets = {'start': zoom_start, 'end': zoom_end}
+
+    def build_volatility_line():
+        airline_closes = close_matrix(price_store, airline_symbols, zoom_start, zoom_end)
+        volatility_line = time_series_figure(airline_closes, title='Airline Stock Closing Prices')
+        volatility_line.update_layout(title_font_size=25, title_x=0.5, legend_font_size=14)
+        volatility_line.update_xaxes(showgrid=True, gridwidth=1, gridcolor='Black')
+        volatility_line.update_yaxes(showgrid=True, gridwidth=1, gridcolor='Black')
+        return volatility_line
+    st.plotly_chart(figure_cache.figure('Data Analysis', 'volatility_line', window_widgets, build_volatility_line))
+    st.markdown('As shown on the line graph above, in terms of volatility, we would definitely not invest in the airline firm ALK due to its various large drops as in the year 2012 and 2014; Also, the company ALK pertains a high frequency of approximate 10 dollar drops regarding its closing prices over the time span of 2010-2016 as compared to its competitors, which demonstrates the stock\'s liability to change rapidly and unpredictably, as well as the high risk the investment accompanies. On the other hand, the other four airline stocks seems to be showing a relatively stable upwards trend, with only one to two approximate 10 dollar drops during the year 2015.') 
+
+   # Volatility is the sample standard deviation of each airline's closing prices over
+   # the selected window, read off the price store's precomputed prefix sums
+    with stage('airline window statistics') as current:
+        airline_stats = current.record(price_store.window_statistics(airline_symbols, zoom_start, zoom_end))
+
+    def build_airline_standard_deviation():
+        airline_s_d = airline_stats.reset_index()[['ticker_symbol', 'standard_deviation']]
+        airline_standard_deviation = px.bar(airline_s_d, x='ticker_symbol', y='standard_deviation', title='Standard Deviation', text_auto=True, labels={'standard_deviation':'Standard Deviation', 'ticker_symbol':'Ticker Symbol'}, color='ticker_symbol')
+        airline_standard_deviation.update_layout(title_font_size=25, title_x=0.5)
+        airline_standard_deviation.update_xaxes(tickfont=dict(size=15), showgrid=False)
+        airline_standard_deviation.update_yaxes(tickfont=dict(size=12), range=(0,20), showgrid=False)
+        airline_standard_deviation.update_traces(textfont_size=15, textposition='outside',
+                                             texttemplate='<b>%{y}</b>'
+                                            )
+        return airline_standard_deviation
+    st.plotly_chart(figure_cache.figure('Data Analysis', 'airline_standard_deviation', window_widgets, build_airline_standard_deviation))
+    # A window with a single trading day has no standard deviation
+    ranked_s_d = airline_stats['standard_deviation'].replace([np.inf, -np.inf], np.nan).dropna().sort_values(ascending=False)
+    middle_s_d = ranked_s_d.iloc[1:-1]
+    if ranked_s_d.empty:
+        st.markdown(TOO_FEW_DAYS)
+    else:
+        st.markdown('Over the selected date range, the firm ' + ranked_s_d.index[0] + f' with a standard deviation of {ranked_s_d.iloc[0]:.5f} ranks 1st as compared to its peer group' + ('; While the closing prices of the firms ' + ', '.join(f'{symbol} ({value:.5f})' for symbol, value in middle_s_d.items()) + ' fall in between' if len(middle_s_d) else '') + '. On the other end, the closing prices of ' + ranked_s_d.index[-1] + f' pertain the lowest standard deviation, {ranked_s_d.iloc[-1]:.5f}, indicating the firm\'s relative low risk of investment. Therefore in terms of volatility of the airline stocks, the firm ' + ranked_s_d.index[-1] + ' would be our top stock to invest.')
+
+    st.markdown('Volatility also changes over time. The chart below shows the annualized standard deviation of each airline\'s daily log returns over a rolling window of trading days.')
+    rolling_window = st.selectbox('Rolling window (trading days)', ROLLING_WINDOWS, index=1)
+
+    def build_rolling_volatility_line():
+        rolling = price_store.rolling_volatility((rolling_window,), airline_symbols, zoom_start, zoom_end)
+        rolling_volatility_line = time_series_figure(wide_matrix(rolling, f'volatility_{rolling_window}d', airline_symbols),
+                                                     title=f'{rolling_window}-Day Rolling Volatility')
+        rolling_volatility_line.update_layout(title_font_size=25, title_x=0.5, legend_font_size=14, yaxis_title='Annualized Volatility')
+        return rolling_volatility_line
+    st.plotly_chart(figure_cache.figure('Data Analysis', 'rolling_volatility_line', dict(window_widgets, window=rolling_window),
+                                        build_rolling_volatility_line))
+   
+    st.subheader('Factor 3: Relative Price Strength')
+    st.markdown('Relative price strength measures the ratio between a stock\'s and market\'s price trend, and are widely utilized in technical analysis for the return rate of a stock. On the other hand, relative price strength (RPS) could also be misleading because the calculation process (dividing the price trend of the market by that of the stock) doesn\'t take into account risk factors(e.g longevity risk). Moreover, an RPS(relative price strength) greater than 1 indicates that the stock outperformed the market, and an RPS lower than 1 suggests that the stock underperformed the market, while an RPS equivalent to 1 indicates that the stock performed on par with the market.')
+   
+   # Formula: Relative Price Strength = Trend Price of a Stock / Trend Price of the Market
+   # Trend Price of a Stock = the percentage of stock price changed over a period of time
+   # Trend Price of the Market = the percentage of market change over a period of time
+   # Since we are comparing the 5 stocks in the airline industry, in this case we could
+   # simply switch the denominator of the RPS formula to the trend price of the airline
+   # industry
+    with stage('relative price strength'):
+        RPS_df = relative_price_strength(airline_stats).rename('RPS').reset_index()
+   # Plotting a bar graph for the RPS values of each airline stock
+    def build_airlines_rps():
+        finite_rps = RPS_df['RPS'][np.isfinite(RPS_df['RPS'])]
+        airlines_rps = px.bar(RPS_df, x='ticker_symbol', y='RPS', color='ticker_symbol', text_auto=True, labels={'ticker_symbol':'Ticker Symbol'}, title='Relative Price Strength (RPS)')
+        airlines_rps.update_layout(title_font_size=25, title_x=0.5)
+        airlines_rps.update_traces(textfont_size=15, textposition='outside')
+        airlines_rps.update_xaxes(tickfont=dict(size=15), showgrid=False)
+        airlines_rps.update_yaxes(tickfont=dict(size=12), range=(min(0, finite_rps.min()) - 0.5, max(1, finite_rps.max()) + 1), showgrid=False)
+        airlines_rps.add_traces(go.Scatter(x=RPS_df['ticker_symbol'], y=[1] * len(RPS_df), mode = 'lines', name='Benchmark', line_color='black'))
+        return airlines_rps
+   
+    st.plotly_chart(figure_cache.figure('Data Analysis', 'airlines_rps', window_widgets, build_airlines_rps))
+    # Without a price trend over the window (e.g. a single day) the RPS is NaN or infinite
+    ranked_rps = RPS_df[np.isfinite(RPS_df['RPS'])].sort_values('RPS', ascending=False)
+    outperformed = ranked_rps[ranked_rps['RPS'] > 1]
+    underperformed = ranked_rps[ranked_rps['RPS'] <= 1]
+    if ranked_rps.empty:
+        st.markdown(TOO_FEW_DAYS)
+    else:
+        st.markdown('In the bar graph above, the airline firms ' + ', '.join(f"{row.ticker_symbol} ({row.RPS:.4f})" for row in outperformed.itertuples()) + ' outperformed their peer group, while ' + (', '.join(f"{row.ticker_symbol} ({row.RPS:.4f})" for row in underperformed.itertuples()) or 'no firm') + ' underperformed it. In terms of the relative price strength of stocks, we desire the values to be as high as possible, since the greater the RPS value, the greater the margin which the firm outperformed the market, hence suggesting a relatively high return rate on investment. Therefore in this case our desired investment would be on the stock ' + ranked_rps['ticker_symbol'].iloc[0] + '.')
+
+    st.header('Sector Screen')
+    st.markdown('To put the airlines in context, the same measures can be computed for every stock in \'securities.csv\' over the selected date range: each stock\'s beta and correlation against an equally weighted index of its GICS sector, the annualized volatility of its daily returns, and its relative price strength ranked within its sub-industry. A beta above 1 means the stock tends to move more than its sector, and a beta below 1 means it tends to move less.')
+    with stage('cross section') as current:
+        screen, correlation = current.record(load_cross_section(zoom_start, zoom_end))
+    sectors = sorted(screen['gics_sector'].dropna().unique())
+    sector = st.selectbox('Select the sector you would like to screen', sectors,
+                          index=sectors.index('Industrials') if 'Industrials' in sectors else 0)
+    sector_screen = screen[screen['gics_sector'] == sector].sort_values(['gics_sub_industry', 'rps_rank'])
+    paginated_table(sector_screen.reset_index(), key='sector_screen')
+
+    def build_sector_correlation():
+        symbols = sector_screen.index.tolist()
+        sector_correlation = px.imshow(correlation.loc[symbols, symbols], zmin=-1, zmax=1, color_continuous_scale='RdBu',
+                                       title=f'Correlation of Daily Returns: {sector}', labels={'color': 'Correlation'})
+        sector_correlation.update_layout(title_font_size=25, title_x=0.5)
+        return sector_correlation
+    st.plotly_chart(figure_cache.figure('Data Analysis', 'sector_correlation', dict(window_widgets, sector=sector),
+                                        build_sector_correlation))
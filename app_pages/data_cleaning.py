@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Data Cleaning page: how the merged and filtered datasets are built."""
+
+import streamlit as st
+
+from app_pages.common import airline_datasets
+from tables import paginated_table
+
+
+def render():
+    airlines_2015, airline_symbols, price_store, all_prices = airline_datasets()
+
+    st.title('Data Cleaning')
+    st.header('First Dataset')
+    st.markdown('To start off our data cleaning process, we will remove unnecessary elements in the column title of the \'fundamentals.csv\' dataset.')
+    st.code('cleaned_columns = [column.replace(\'\'\', \'\').replace(\'.\', \'\').replace(\' \', \'_\').replace(\'-\', \'_\').replace(\'/\', \'_\').lower() for column in fundamentals.columns]', language="python")
+    st.markdown('Merge \'fundamentals.csv\' with \'securities.csv\', to enrich the string values in the \'fundamentals.csv\' dataset, specifically the qualitative data of each firm(E.g. industry).')
+    st.code('combined = fundamentals.merge(securities, on=\'ticker_symbol\')', language='Python')
+    st.markdown('As accordingly to the investigation purpose of this case study, we are trying to reach an accurate conclusion for the top airline stock to invest in for the year 2016, so we should filter out companies in the \"Airlines\" industry.')
+    st.code('airlines = combined[combined[\'gics_sub_industry\'] == \'Airlines\'].copy()', language='Python')
+    st.markdown('From the table above, we can deduce that in our merged dataset \'combined\',in total there are 5 firms present. Represented by their ticker symbol: #\'AAL\', \'ALK\', \'DAL\', \'LUV\', and \'UAL\'. Since in this Python Visualization project we are focusing on data that is representative of statistics from the year 2015 and before, the next step in our agenda will be filtering rows where the \'period_ending\' column equals \'2015-12-31\'.')
+    st.code('airlines_2015 = airlines[airlines[\'period_ending\'] == \'2015-12-31\']', language='Python')
+    st.markdown('Note: the \'airlines_2015\' dataset will be used to evaluate the financial performance of the airline stocks, namely their cash ratio and current ratio.')
+    st.caption('Click on the expand key to zoom in')
+    st.write(airlines_2015)
+    
+    st.header('Second Dataset')
+    st.markdown('To ensure the clarity of the column labels of the \'all_prices.csv\' dataset, we should add the corresponding measurement unit(USD) for the \'low\' and \'high\' columns.')
+    st.code('all_prices.rename(columns={\'low\':\'low (USD)\', \'high\':\'high (USD)\'})', language='Python')
+    st.markdown('Since we\'re providing a foresight of the top stocks to invest in for the year 2016, we should remove data from \'2016-00-00\' onwards to ensure the accuracy of the analysis.')
+    st.code('all_prices = price_store.window(airline_symbols, end=\'2015-12-31\')', language='Python')
+    st.markdown('Note: the \'all_prices\' dataset will be used to evaluate the return on investment of the airline stocks, namely the volatility and relative price strength of their stock prices.')
+    st.caption('Click on the expand key to zoom in')
+    paginated_table(all_prices, key='all_prices')
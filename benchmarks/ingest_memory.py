@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Peak memory of streaming price ingest versus a plain pd.read_csv.
+
+Writes a synthetic multi-GB price file (reused if it already exists) and runs
+each ingest mode in a fresh interpreter, reporting its peak RSS:
+
+    python benchmarks/ingest_memory.py --size-gb 2 --path /tmp/prices_2gb.csv
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+MODES = ('stream_aggregates', 'stream_window', 'read_csv')
+
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_mode(mode, path, chunksize):
+    import pandas as pd
+    import ingest
+
+    started = time.perf_counter()
+    symbols = ['S0000', 'S0001', 'S0002', 'S0003', 'S0004']
+    if mode == 'stream_aggregates':
+        rows = len(ingest.stream_price_aggregates(path, chunksize=chunksize))
+    elif mode == 'stream_window':
+        rows = len(ingest.load_prices_streaming(path, symbols, '2010-01-01', '2015-12-31', chunksize=chunksize))
+    else:
+        rows = len(pd.read_csv(path))
+    return {'mode': mode, 'rows': rows, 'seconds': time.perf_counter() - started, 'peak_rss_mb': peak_rss_mb()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--path', default='/tmp/dataquest_prices_synthetic.csv')
+    parser.add_argument('--size-gb', type=float, default=2.0)
+    parser.add_argument('--symbols', type=int, default=2000)
+    parser.add_argument('--chunksize', type=int, default=250_000)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--worker', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_mode(args.worker, args.path, args.chunksize)))
+        return
+
+    target_bytes = int(args.size_gb * 1024 ** 3)
+    if not os.path.exists(args.path) or os.path.getsize(args.path) < target_bytes:
+        from synthetic import write_prices
+        print(f'writing {args.size_gb:g} GB synthetic price file to {args.path}', file=sys.stderr)
+        write_prices(args.path, n_symbols=args.symbols, target_bytes=target_bytes)
+
+    results = []
+    for mode in args.modes:
+        output = subprocess.run([sys.executable, __file__, '--worker', mode, '--path', args.path,
+                                 '--chunksize', str(args.chunksize)],
+                                check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        result['file_mb'] = os.path.getsize(args.path) / 1024 ** 2
+        results.append(result)
+        print(f"{mode:>18}: {result['peak_rss_mb']:8.1f} MB peak RSS, {result['seconds']:7.1f} s, {result['rows']} rows",
+              file=sys.stderr)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
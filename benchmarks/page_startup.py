@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Time to first render of each dashboard page, checked against a budget.
+
+Every page is rendered in a fresh interpreter with Streamlit in bare mode
+(widgets return their defaults, nothing is sent to a browser), starting from a
+cold process as on the first request after a deploy. The heavy modules each
+page pulls in on top of streamlit are reported too, so an import that leaks
+onto a text-only page shows up here. Exits with status 1 when a page fails or goes over its budget;
+network errors are reported but tolerated so the check also runs offline:
+
+    python benchmarks/page_startup.py
+    python benchmarks/page_startup.py --pages Abstract "Data Analysis" --scale 1.5
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+# Seconds from process start (after importing streamlit) to the end of render()
+BUDGETS = {
+    'Abstract': 1.5,
+    'Background Information': 3.0,
+    'Data Cleaning': 3.0,
+    'Data Analysis': 6.0,
+    'Conclusion': 2.0,
+    'Bibliography': 1.5,
+}
+HEAVY_MODULES = ('pandas', 'plotly', 'requests', 'streamlit_lottie', 'pyarrow')
+
+
+def render_page(title):
+    import streamlit  # noqa: F401  the app always pays for streamlit itself
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+    preloaded = set(sys.modules)
+    started = time.perf_counter()
+    import app_pages
+    error, offline = None, False
+    try:
+        app_pages.render(title)
+    except Exception as exc:
+        error = f'{type(exc).__name__}: {exc}'
+        # The Conclusion page fetches its animation over the network
+        offline = type(exc).__module__.startswith('requests')
+    return {
+        'page': title,
+        'seconds': time.perf_counter() - started,
+        'heavy_modules': [name for name in HEAVY_MODULES if name in sys.modules and name not in preloaded],
+        'error': error,
+        'offline': offline,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', nargs='+', choices=list(BUDGETS), default=list(BUDGETS))
+    parser.add_argument('--scale', type=float, default=1.0, help='multiply every budget, e.g. on slow CI machines')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(render_page(args.worker)))
+        return
+
+    results, over_budget = [], False
+    for title in args.pages:
+        output = subprocess.run([sys.executable, __file__, '--worker', title], cwd=REPO_DIR,
+                                check=True, capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        result['budget'] = BUDGETS[title] * args.scale
+        result['ok'] = (result['error'] is None or result['offline']) and result['seconds'] <= result['budget']
+        over_budget |= not result['ok']
+        results.append(result)
+        status = 'ok' if result['ok'] else 'FAIL'
+        print(f"{title:>22}: {result['seconds']:6.3f} s (budget {result['budget']:.1f} s) {status:>4}  "
+              f"imports: {', '.join(result['heavy_modules']) or '-'}"
+              + (f"  error: {result['error']}" if result['error'] else ''), file=sys.stderr)
+    print(json.dumps(results, indent=2))
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
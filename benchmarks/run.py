@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite for ingest, analytics and page rendering at 1x, 10x and 100x
+the size of the shipped datasets.
+
+Each scale runs in its own interpreter against synthetic data from
+benchmarks/synthetic.py (generated once into --data-dir and reused), so the
+process-wide caches start cold. Every stage is timed --repeat times and the
+median is kept. Results are written as JSON; with --baseline, any stage
+slower than the baseline by more than --threshold, and by more than --floor
+seconds, fails the run:
+
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --scales 1 10 --baseline bench.json --threshold 0.25
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+sys.path.insert(0, BENCH_DIR)
+
+# Slowdowns smaller than this are timer noise, whatever the relative change
+NOISE_FLOOR = 0.005
+PAGES = ('Abstract', 'Background Information', 'Data Cleaning', 'Data Analysis', 'Bibliography')
+
+
+def _timed(repeat, stage, setup=None):
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        stage()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def _render_page(title):
+    """Headless page render: Streamlit's AppTest harness when available, bare mode otherwise."""
+    from unittest import mock
+    try:
+        from streamlit.testing.v1 import AppTest
+    except ImportError:
+        import app_pages
+        app_pages.render(title)
+        return
+    with mock.patch('streamlit_option_menu.option_menu', return_value=title):
+        app = AppTest.from_file(os.path.join(REPO_DIR, 'DataQuest_Notes.py'), default_timeout=600)
+        app.run()
+    if app.exception:
+        raise RuntimeError(f'{title}: {app.exception[0].value}')
+
+
+def run_stages(repeat):
+    """Time every stage against the data in DATAQUEST_DATA_DIR; returns {stage: seconds}."""
+    import pandas as pd
+
+    import analytics
+    import data_loader
+    from cross_section import cross_section
+    from price_store import PriceStore
+
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+    results = {}
+    paths = (data_loader.FUNDAMENTALS_CSV, data_loader.PRICES_CSV, data_loader.SECURITIES_CSV)
+    parsers = (data_loader.parse_fundamentals, data_loader.parse_prices, data_loader.parse_securities)
+
+    def clear_caches():
+        data_loader._datasets.clear()
+        data_loader._merge_cached.cache_clear()
+        data_loader._price_store_cached.cache_clear()
+        data_loader._ratios_cached.cache_clear()
+
+    results['csv_load'] = _timed(repeat, lambda: [parse(path) for parse, path in zip(parsers, paths)])
+    data_loader.load_fundamentals(), data_loader.load_prices(), data_loader.load_securities()
+    results['sidecar_load'] = _timed(repeat, lambda: (data_loader.load_fundamentals(), data_loader.load_prices(),
+                                                      data_loader.load_securities()), setup=clear_caches)
+    results['cached_load'] = _timed(repeat, lambda: (data_loader.load_fundamentals(), data_loader.load_prices(),
+                                                     data_loader.load_securities()))
+
+    fundamentals, prices, securities = (data_loader.load_fundamentals(), data_loader.load_prices(),
+                                        data_loader.load_securities())
+    raw_fundamentals = pd.read_csv(data_loader.FUNDAMENTALS_CSV)
+    results['clean_merge'] = _timed(repeat, lambda: raw_fundamentals.set_axis(
+        data_loader.clean_fundamentals_columns(raw_fundamentals.columns), axis=1).merge(securities, on='ticker_symbol'))
+    combined = data_loader.load_combined()
+
+    symbols = prices['symbol'].cat.categories.tolist()
+    results['price_store_build'] = _timed(repeat, lambda: PriceStore(prices))
+    store = data_loader.load_price_store()
+    # Both per-ticker stages select the same 50 tickers and date range
+    sample = symbols[:50]
+    end = pd.Timestamp('2015-12-31')
+    results['per_ticker_slice_50'] = _timed(repeat, lambda: store.window(sample, end=end))
+    results['per_ticker_mask_50'] = _timed(repeat, lambda: pd.concat(
+        [prices[(prices['symbol'] == symbol) & (prices['date'] <= end)] for symbol in sample]))
+
+    results['volatility'] = _timed(repeat, lambda: store.window_statistics(symbols, end='2015-12-31'))
+    stats = store.window_statistics(symbols, end='2015-12-31')
+    results['rps'] = _timed(repeat, lambda: analytics.relative_price_strength(stats))
+    results['rolling_volatility'] = _timed(repeat, lambda: store.rolling_volatility(symbols=symbols))
+    results['current_ratio'] = _timed(repeat, lambda: analytics.liquidity_ratios(combined))
+    results['cross_section'] = _timed(repeat, lambda: cross_section(store, securities, end='2015-12-31'))
+    # Spawned pool at every scale, whatever the size threshold
+    results['cross_section_pool'] = _timed(repeat, lambda: cross_section(store, securities, end='2015-12-31',
+                                                                         workers=2, min_cells=0))
+    data_loader.load_ratios()
+
+    for title in PAGES:
+        results[f'render_{title.lower().replace(" ", "_")}'] = _timed(repeat, lambda: _render_page(title))
+    results['_rows'] = {'fundamentals': len(fundamentals), 'prices': len(prices), 'securities': len(securities)}
+    return results
+
+
+def compare(results, baseline, threshold, floor=NOISE_FLOOR):
+    """
+    Stages slower than baseline * (1 + threshold) and by more than `floor`
+    seconds, as (scale, stage, seconds, baseline seconds).
+    """
+    regressions = []
+    for scale, stages in results['scales'].items():
+        for stage, seconds in stages.items():
+            before = baseline.get('scales', {}).get(scale, {}).get(stage)
+            if stage.startswith('_') or before is None:
+                continue
+            if seconds > before * (1 + threshold) and seconds - before > floor:
+                regressions.append((scale, stage, seconds, before))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', nargs='+', type=int, default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--data-dir', default=os.path.join('/tmp', 'dataquest_bench'))
+    parser.add_argument('--output', help='write results JSON here (default: stdout)')
+    parser.add_argument('--baseline', help='previous results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed slowdown per stage, 0.2 = 20%%')
+    parser.add_argument('--floor', type=float, default=NOISE_FLOOR,
+                        help='ignore slowdowns under this many seconds (default: %(default)s)')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_stages(args.repeat)))
+        return
+
+    from synthetic import generate_dataset
+
+    results = {'python': platform.python_version(), 'machine': platform.machine(),
+               'repeat': args.repeat, 'scales': {}}
+    for scale in args.scales:
+        directory = os.path.join(args.data_dir, f'{scale}x')
+        if not os.path.exists(os.path.join(directory, 'prices1.csv')):
+            print(f'generating {scale}x dataset in {directory}', file=sys.stderr)
+            generate_dataset(directory, scale)
+        env = dict(os.environ, DATAQUEST_DATA_DIR=directory)
+        output = subprocess.run([sys.executable, __file__, '--worker', '--repeat', str(args.repeat)],
+                                cwd=REPO_DIR, env=env, check=True, capture_output=True, text=True).stdout
+        results['scales'][f'{scale}x'] = json.loads(output.strip().splitlines()[-1])
+        for stage, seconds in results['scales'][f'{scale}x'].items():
+            if not stage.startswith('_'):
+                print(f'{scale:>4}x {stage:>32}: {seconds * 1000:10.2f} ms', file=sys.stderr)
+
+    serialized = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(serialized)
+    else:
+        print(serialized)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold, args.floor)
+        for scale, stage, seconds, before in regressions:
+            print(f'REGRESSION {scale} {stage}: {seconds * 1000:.2f} ms vs {before * 1000:.2f} ms baseline',
+                  file=sys.stderr)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
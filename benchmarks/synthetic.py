@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic datasets shaped like the Kaggle NYSE files used by the dashboard.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def synthetic_symbols(n_symbols):
+    return [f'S{i:04d}' for i in range(n_symbols)]
+
+
+def write_prices(path, n_symbols=500, n_days=None, target_bytes=None, start='2010-01-04', seed=0, days_per_block=250):
+    """
+    Write a prices.csv lookalike (date,symbol,open,close,low,high,volume).
+
+    Rows are grouped by date like the original file. Generation stops after
+    `n_days` trading days, or once the file reaches `target_bytes`.
+    """
+    if n_days is None and target_bytes is None:
+        raise ValueError('pass n_days or target_bytes')
+    rng = np.random.default_rng(seed)
+    symbols = np.array(synthetic_symbols(n_symbols))
+    level = rng.uniform(5, 150, n_symbols)
+    day = pd.Timestamp(start)
+    written_days = 0
+
+    with open(path, 'w') as f:
+        f.write('date,symbol,open,close,low,high,volume\n')
+        while True:
+            days = days_per_block if n_days is None else min(days_per_block, n_days - written_days)
+            if days <= 0:
+                break
+            dates = pd.bdate_range(day, periods=days)
+            day = dates[-1] + pd.offsets.BDay()
+
+            # Geometric random walk per symbol, one row per (date, symbol)
+            returns = rng.normal(0.0003, 0.02, (days, n_symbols))
+            close = level * np.exp(np.cumsum(returns, axis=0))
+            level = close[-1]
+            open_ = close * np.exp(rng.normal(0, 0.005, close.shape))
+            spread = np.abs(rng.normal(0, 0.01, close.shape)) * close
+            block = pd.DataFrame({
+                'date': np.repeat(dates.strftime('%Y-%m-%d'), n_symbols),
+                'symbol': np.tile(symbols, days),
+                'open': open_.ravel().round(6),
+                'close': close.ravel().round(6),
+                'low': (np.minimum(open_, close) - spread).ravel().round(6),
+                'high': (np.maximum(open_, close) + spread).ravel().round(6),
+                'volume': rng.integers(100_000, 50_000_000, close.size).astype('float64'),
+            })
+            block.to_csv(f, header=False, index=False)
+            written_days += days
+            if target_bytes is not None and f.tell() >= target_bytes:
+                break
+    return os.path.getsize(path)
+
+
+def _real_path(name):
+    return os.path.join(REPO_DIR, name)
+
+
+def generate_dataset(directory, scale=1, seed=0):
+    """
+    Write fundamentals.csv, prices1.csv and securities.csv at `scale` times the
+    size of the shipped files, with the same headers.
+
+    Scale 1 is the shipped data. Larger scales add synthetic tickers cloned
+    from real securities (same sub-industries, jittered fundamentals) and give
+    five more tickers a random-walk price history per unit of scale, so the
+    prices file at scale 100 is about the size of the full NYSE file.
+    """
+    os.makedirs(directory, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    securities = pd.read_csv(_real_path('securities.csv'), dtype=str, keep_default_na=False)
+    fundamentals = pd.read_csv(_real_path('fundamentals.csv'))
+    prices = pd.read_csv(_real_path('prices1.csv'))
+
+    extra = (scale - 1) * len(securities)
+    sources = securities.sample(extra, replace=True, random_state=seed) if extra else securities.iloc[0:0]
+    new_symbols = synthetic_symbols(extra)
+    clones = sources.assign(**{'Ticker symbol': new_symbols, 'Security': [f'Synthetic {s}' for s in new_symbols]})
+    pd.concat([securities, clones]).to_csv(os.path.join(directory, 'securities.csv'), index=False)
+
+    # Each synthetic ticker files the same 10-Ks as the ticker it was cloned from
+    by_ticker = dict(tuple(fundamentals.groupby('Ticker Symbol')))
+    cloned = [by_ticker[source].assign(**{'Ticker Symbol': symbol})
+              for source, symbol in zip(sources['Ticker symbol'], new_symbols) if source in by_ticker]
+    synthetic_fundamentals = pd.concat([fundamentals] + cloned, ignore_index=True)
+    numeric = synthetic_fundamentals.columns[2:]
+    jitter = rng.uniform(0.8, 1.2, (len(synthetic_fundamentals) - len(fundamentals), len(numeric)))
+    synthetic_fundamentals.loc[len(fundamentals):, numeric] = synthetic_fundamentals.loc[len(fundamentals):, numeric].to_numpy() * jitter
+    synthetic_fundamentals.to_csv(os.path.join(directory, 'fundamentals.csv'), index=False)
+
+    prices_path = os.path.join(directory, 'prices1.csv')
+    prices.to_csv(prices_path, index=False)
+    extra_price_symbols = (scale - 1) * prices['symbol'].nunique()
+    if extra_price_symbols:
+        n_days = prices['date'].nunique()
+        symbols_before = set(prices['symbol'])
+        price_symbols = [s for s in pd.concat([securities, clones])['Ticker symbol'] if s not in symbols_before]
+        tmp_path = prices_path + '.extra'
+        write_prices(tmp_path, n_symbols=extra_price_symbols, n_days=n_days, start=prices['date'].min(), seed=seed)
+        extra_prices = pd.read_csv(tmp_path)
+        mapping = dict(zip(synthetic_symbols(extra_price_symbols), price_symbols[:extra_price_symbols]))
+        extra_prices['symbol'] = extra_prices['symbol'].map(mapping)
+        extra_prices.to_csv(prices_path, mode='a', header=False, index=False)
+        os.remove(tmp_path)
+    return directory
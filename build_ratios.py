@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batch job that materializes liquidity ratios for every ticker, period and
+sub-industry into a Feather table that the dashboard only reads.
+
+    python build_ratios.py           # incremental: only new 10-K rows are computed
+    python build_ratios.py --full    # rebuild from scratch
+
+A run is incremental when securities.csv is unchanged and fundamentals.csv
+only had rows appended since the last build; the ratios of the new filings are
+computed and the industry averages of the (sub-industry, period) groups they
+fall into are refreshed. Any other change triggers a full rebuild.
+
+The dashboard never writes the table: until this job has run against the
+current CSVs it computes the ratios in memory (see data_loader.load_ratios).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import pandas as pd
+
+from analytics import INDUSTRY_KEY, add_industry_averages, liquidity_ratios
+from data_loader import (FUNDAMENTALS_CSV, RATIOS_TABLE, SECURITIES_CSV, file_fingerprint,
+                         parse_fundamentals, parse_securities)
+
+KEY = ['ticker_symbol', 'period_ending']
+
+
+def _hash(path, size=None):
+    """SHA-1 of the first `size` bytes of a file (the whole file by default)."""
+    digest = hashlib.sha1()
+    remaining = os.path.getsize(path) if size is None else size
+    with open(path, 'rb') as f:
+        while remaining > 0:
+            block = f.read(min(1 << 20, remaining))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def _source_state(path):
+    mtime_ns, size = file_fingerprint(path)
+    return {'mtime_ns': mtime_ns, 'size': size, 'sha1': _hash(path)}
+
+
+def _read_meta(output):
+    try:
+        with open(output + '.json') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(output=RATIOS_TABLE, fundamentals_path=FUNDAMENTALS_CSV, securities_path=SECURITIES_CSV):
+    """
+    True when `output` was built from the current source files. The files are
+    only hashed when their mtime changed but not their size (e.g. a fresh checkout).
+    """
+    meta = _read_meta(output)
+    if meta is None or not os.path.exists(output):
+        return False
+    for name, path in (('fundamentals', fundamentals_path), ('securities', securities_path)):
+        mtime_ns, size = file_fingerprint(path)
+        if meta[name]['size'] != size:
+            return False
+        if meta[name]['mtime_ns'] != mtime_ns and meta[name]['sha1'] != _hash(path):
+            return False
+    return True
+
+
+def _is_append(previous, path):
+    """fundamentals.csv still starts with exactly the bytes the previous build read."""
+    size = os.path.getsize(path)
+    return size >= previous['size'] and _hash(path, previous['size']) == previous['sha1']
+
+
+def build_ratios(fundamentals_path=FUNDAMENTALS_CSV, securities_path=SECURITIES_CSV, output=RATIOS_TABLE, full=False):
+    """Build or update the ratios table; returns (ratios, number of filings computed, incremental?)."""
+    fundamentals = parse_fundamentals(fundamentals_path)
+    securities = parse_securities(securities_path)
+    sources = {'fundamentals': _source_state(fundamentals_path), 'securities': _source_state(securities_path)}
+
+    meta = None if full else _read_meta(output)
+    existing = None
+    if meta is not None and os.path.exists(output) \
+            and meta['securities']['sha1'] == sources['securities']['sha1'] \
+            and _is_append(meta['fundamentals'], fundamentals_path):
+        existing = pd.read_feather(output)
+
+    if existing is None:
+        ratios = liquidity_ratios(fundamentals.merge(securities, on='ticker_symbol'))
+        computed = len(ratios)
+    else:
+        known = pd.MultiIndex.from_frame(existing[KEY])
+        new_filings = fundamentals[~pd.MultiIndex.from_frame(fundamentals[KEY]).isin(known)]
+        new = liquidity_ratios(new_filings.merge(securities, on='ticker_symbol'))
+        computed = len(new)
+        ratios = pd.concat([existing, new[existing.columns]], ignore_index=True)
+        if computed:
+            touched = pd.MultiIndex.from_frame(ratios[INDUSTRY_KEY]).isin(pd.MultiIndex.from_frame(new[INDUSTRY_KEY]))
+            ratios = add_industry_averages(ratios, touched)
+
+    ratios = ratios.sort_values(INDUSTRY_KEY + ['ticker_symbol'], kind='mergesort').reset_index(drop=True)
+    partial = f'{output}.{os.getpid()}.partial'
+    ratios.to_feather(partial)
+    os.replace(partial, output)
+    with open(output + '.json', 'w') as f:
+        json.dump(sources, f)
+    return ratios, computed, existing is not None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--fundamentals', default=FUNDAMENTALS_CSV)
+    parser.add_argument('--securities', default=SECURITIES_CSV)
+    parser.add_argument('--output', default=RATIOS_TABLE)
+    parser.add_argument('--full', action='store_true', help='ignore the existing table and rebuild everything')
+    args = parser.parse_args(argv)
+
+    ratios, computed, incremental = build_ratios(args.fundamentals, args.securities, args.output, args.full)
+    mode = 'incremental' if incremental else 'full'
+    print(f'{mode} build: computed {computed} filings, {len(ratios)} rows across '
+          f'{ratios["gics_sub_industry"].nunique()} sub-industries -> {args.output}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Downsampled WebGL time-series charts.
+
+Closing prices are pivoted once into a wide date x symbol frame, then reduced
+to a few points per horizontal pixel with a shape-preserving downsampler before
+they are handed to Plotly as `scattergl` traces. The payload therefore depends
+on the chart width, not on the number of trading days.
+"""
+
+import numpy as np
+import plotly.graph_objects as go
+
+# Streamlit's default chart width; two points per pixel keeps every visible extreme
+VIEWPORT_WIDTH_PX = 700
+POINTS_PER_PX = 2
+
+
+def wide_matrix(frame, values, symbols=None):
+    """Pivot a long (date, symbol) frame into one `values` column per symbol."""
+    long = frame[['date', values]].assign(symbol=frame['symbol'].astype(str))
+    wide = long.pivot(index='date', columns='symbol', values=values)
+    if symbols is not None:
+        wide = wide[[symbol for symbol in symbols if symbol in wide.columns]]
+    wide.columns.name = None
+    return wide
+
+
+def close_matrix(prices, symbols=None, start=None, end=None):
+    """Wide date-indexed frame with one closing price column per symbol."""
+    if hasattr(prices, 'window'):
+        prices = prices.window(symbols, start, end)
+    return wide_matrix(prices, 'close', symbols)
+
+
+def minmax_downsample(values, max_points):
+    """
+    Row positions to keep for each column of a 2-D array.
+
+    Rows are cut into equal buckets and each bucket keeps its minimum and its
+    maximum, for all columns at once. NaNs are never picked unless a bucket is
+    entirely NaN.
+    """
+    n, m = values.shape
+    if n <= max_points:
+        return [np.arange(n)] * m
+    n_buckets = max(1, (max_points - 2) // 2)
+    size = -(-n // n_buckets)
+    padded = np.full((n_buckets * size, m), np.nan)
+    padded[:n] = values
+    blocks = padded.reshape(n_buckets, size, m)
+    missing = np.isnan(blocks)
+    lows = np.where(missing, np.inf, blocks).argmin(axis=1)
+    highs = np.where(missing, -np.inf, blocks).argmax(axis=1)
+
+    offsets = (np.arange(n_buckets) * size)[:, None]
+    picks = np.minimum(np.concatenate([lows + offsets, highs + offsets]), n - 1)
+    return [np.unique(np.r_[0, picks[:, column], n - 1]) for column in range(m)]
+
+
+def lttb(x, y, max_points):
+    """Largest-Triangle-Three-Buckets: positions of `max_points` points that best keep the line's shape."""
+    n = len(x)
+    if n <= max_points or max_points < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)
+    picked = np.empty(max_points, dtype=int)
+    picked[0], picked[-1] = 0, n - 1
+
+    a = 0
+    for i in range(max_points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_lo, next_hi = (edges[i + 1], edges[i + 2]) if i + 2 < len(edges) else (n - 1, n)
+        avg_x, avg_y = x[next_lo:next_hi].mean(), y[next_lo:next_hi].mean()
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        picked[i + 1] = a
+    return picked
+
+
+def downsample(wide, max_points, method='minmax'):
+    """Row positions to keep for each column of `wide`; 'lttb' is sharper but loops per bucket."""
+    values = wide.to_numpy(dtype='float64')
+    if method == 'minmax':
+        return minmax_downsample(values, max_points)
+    x = wide.index.to_numpy().astype('int64')
+    positions = []
+    for column in range(values.shape[1]):
+        present = np.flatnonzero(~np.isnan(values[:, column]))
+        positions.append(present[lttb(x[present], values[present, column], max_points)])
+    return positions
+
+
+def time_series_figure(wide, width_px=VIEWPORT_WIDTH_PX, method=None, title=None):
+    """One `scattergl` line per column of `wide`, downsampled to the chart width."""
+    max_points = width_px * POINTS_PER_PX
+    if method is None:
+        # LTTB's per-bucket loop is fine for a handful of lines, min/max scales to hundreds
+        method = 'lttb' if wide.shape[1] <= 10 else 'minmax'
+    values = wide.to_numpy(dtype='float64')
+    figure = go.Figure()
+    for column, rows in zip(range(values.shape[1]), downsample(wide, max_points, method)):
+        figure.add_trace(go.Scattergl(x=wide.index[rows], y=values[rows, column], mode='lines',
+                                      name=str(wide.columns[column])))
+    figure.update_layout(title=title, xaxis_title='Date', yaxis_title='Value ($USD)', legend_title='Variable')
+    return figure
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Data access layer for the stock market dashboard.
+
+Streamlit reruns DataQuest_Notes.py on every widget interaction, so the three
+datasets are parsed once per process and shared by every session. Each parsed
+dataset is also written to a Feather sidecar next to its CSV, which is rebuilt
+whenever the CSV changes, so that later cold starts skip CSV parsing.
+
+The frames returned here are shared between reruns and users: treat them as
+read-only and `.copy()` before adding columns.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from functools import lru_cache
+
+import pandas as pd
+
+from price_store import PriceStore
+from profiling import stage, timed
+
+# DATAQUEST_DATA_DIR points the app at another copy of the three CSVs (e.g. benchmark data)
+DATA_DIR = os.environ.get('DATAQUEST_DATA_DIR', os.path.dirname(os.path.abspath(__file__)))
+FUNDAMENTALS_CSV = os.path.join(DATA_DIR, 'fundamentals.csv')
+PRICES_CSV = os.path.join(DATA_DIR, 'prices1.csv')
+SECURITIES_CSV = os.path.join(DATA_DIR, 'securities.csv')
+RATIOS_TABLE = os.path.join(DATA_DIR, 'ratios.feather')
+
+PRICE_DTYPES = {'symbol': 'category', 'open': 'float32', 'close': 'float32',
+                'low': 'float32', 'high': 'float32', 'volume': 'float64'}
+
+# DATAQUEST_STREAM_PRICES=1 reads the price file in chunks (see ingest.py), keeping only the
+# tickers in DATAQUEST_PRICE_SYMBOLS (comma-separated; default: every ticker in securities.csv)
+# between DATAQUEST_PRICE_START and DATAQUEST_PRICE_END
+STREAM_PRICES = os.environ.get('DATAQUEST_STREAM_PRICES', '').strip().lower() not in ('', '0', 'false', 'off')
+
+_load_lock = threading.Lock()
+# path -> (variant, fingerprint, frame): only the latest version of each file stays in memory
+_datasets = {}
+
+
+def clean_fundamentals_columns(columns):
+    return [column.replace('\'', '').replace('.', '').replace(' ', '_').replace('-', '_').replace('/', '_').lower() for column in columns]
+
+
+def clean_securities_columns(columns):
+    return [column.replace(' ', '_').lower() for column in columns]
+
+
+def parse_fundamentals(path):
+    fundamentals = pd.read_csv(path)
+    fundamentals.columns = clean_fundamentals_columns(fundamentals.columns)
+    return fundamentals
+
+
+def parse_prices(path):
+    return pd.read_csv(path, dtype=PRICE_DTYPES, parse_dates=['date'])
+
+
+def parse_prices_streaming(path, symbols=None, start=None, end=None):
+    from ingest import load_prices_streaming
+
+    return load_prices_streaming(path, symbols, start, end)
+
+
+def parse_securities(path):
+    securities = pd.read_csv(path)
+    securities.columns = clean_securities_columns(securities.columns)
+    return securities
+
+
+def file_fingerprint(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _file_hash(path):
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _sidecar_paths(path):
+    return path + '.feather', path + '.feather.json'
+
+
+def _read_sidecar(path, variant=''):
+    sidecar, meta_path = _sidecar_paths(path)
+    try:
+        with open(meta_path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get('variant', '') != variant:
+        return None
+
+    mtime_ns, size = file_fingerprint(path)
+    if (meta.get('mtime_ns'), meta.get('size')) != (mtime_ns, size):
+        # A touched-but-identical CSV (e.g. a fresh checkout) keeps its sidecar
+        if meta.get('size') != size or meta.get('sha1') != _file_hash(path):
+            return None
+        meta['mtime_ns'] = mtime_ns
+        _write_meta(meta_path, meta)
+
+    try:
+        return pd.read_feather(sidecar)
+    except (OSError, ImportError, ValueError):
+        return None
+
+
+def _write_meta(meta_path, meta):
+    try:
+        with open(meta_path, 'w') as f:
+            json.dump(meta, f)
+    except OSError:
+        pass
+
+
+def _write_sidecar(path, frame, variant=''):
+    sidecar, meta_path = _sidecar_paths(path)
+    mtime_ns, size = file_fingerprint(path)
+    try:
+        frame.reset_index(drop=True).to_feather(sidecar)
+    except (OSError, ImportError, ValueError):
+        # Read-only deployments and missing pyarrow fall back to plain CSV parsing
+        return
+    _write_meta(meta_path, {'mtime_ns': mtime_ns, 'size': size, 'sha1': _file_hash(path), 'variant': variant})
+
+
+def _load(path, parse, variant):
+    name = os.path.basename(path)
+    with stage(f'read sidecar {name}') as current:
+        frame = current.record(_read_sidecar(path, variant))
+    if frame is None:
+        with stage(f'parse {name}') as current:
+            frame = current.record(parse(path))
+        with stage(f'write sidecar {name}'):
+            _write_sidecar(path, frame, variant)
+    return frame
+
+
+def load_dataset(path, parse, variant=''):
+    """
+    Return the parsed dataset at `path`, re-reading it only when the file changes.
+
+    `variant` names how `parse` reads the file (e.g. a row filter); a cached
+    frame or sidecar of another variant is not reused.
+    """
+    fingerprint = file_fingerprint(path)
+    with _load_lock:
+        cached = _datasets.get(path)
+        if cached is not None and cached[:2] == (variant, fingerprint):
+            return cached[2]
+        # Release the previous version before parsing the new one
+        _datasets.pop(path, None)
+        frame = _load(path, parse, variant)
+        _datasets[path] = (variant, fingerprint, frame)
+        return frame
+
+
+@timed('load_fundamentals')
+def load_fundamentals():
+    return load_dataset(FUNDAMENTALS_CSV, parse_fundamentals)
+
+
+def price_filter():
+    """(symbols, start, end) kept by streamed price loads, from the environment."""
+    symbols = os.environ.get('DATAQUEST_PRICE_SYMBOLS', '')
+    symbols = [symbol.strip() for symbol in symbols.split(',') if symbol.strip()]
+    if not symbols:
+        symbols = load_securities()['ticker_symbol'].tolist()
+    return sorted(set(symbols)), os.environ.get('DATAQUEST_PRICE_START') or None, os.environ.get('DATAQUEST_PRICE_END') or None
+
+
+@timed('load_prices')
+def load_prices():
+    if not STREAM_PRICES:
+        return load_dataset(PRICES_CSV, parse_prices)
+    symbols, start, end = price_filter()
+    variant = 'stream-' + hashlib.sha1(json.dumps([symbols, start, end]).encode()).hexdigest()
+    return load_dataset(PRICES_CSV, lambda path: parse_prices_streaming(path, symbols, start, end), variant)
+
+
+@timed('load_securities')
+def load_securities():
+    return load_dataset(SECURITIES_CSV, parse_securities)
+
+
+@lru_cache(maxsize=1)
+def _merge_cached(fundamentals_version, securities_version):
+    fundamentals, securities = load_fundamentals(), load_securities()
+    with stage('merge fundamentals/securities') as current:
+        return current.record(fundamentals.merge(securities, on='ticker_symbol'))
+
+
+@timed('load_combined')
+def load_combined():
+    """fundamentals.csv merged with securities.csv on the ticker symbol."""
+    return _merge_cached(data_version(FUNDAMENTALS_CSV), data_version(SECURITIES_CSV))
+
+
+@lru_cache(maxsize=1)
+def _price_store_cached(prices_version):
+    prices = load_prices()
+    with stage('build price store'):
+        return PriceStore(prices)
+
+
+@timed('load_price_store')
+def load_price_store():
+    """Prices sorted by (symbol, date) with a per-symbol row index, see price_store.py."""
+    return _price_store_cached(data_version(PRICES_CSV))
+
+
+@lru_cache(maxsize=1)
+def _ratios_cached(sources_version):
+    import build_ratios
+    from analytics import INDUSTRY_KEY, liquidity_ratios
+
+    ratios = None
+    if build_ratios.is_fresh():
+        try:
+            ratios = pd.read_feather(RATIOS_TABLE)
+        except (OSError, ImportError, ValueError):
+            pass
+    if ratios is None:
+        # Missing, stale or unreadable table: compute it in memory, never write from the app
+        with stage('compute ratios in memory'):
+            ratios = liquidity_ratios(load_combined())
+    return ratios.set_index(INDUSTRY_KEY).sort_index()
+
+
+@timed('load_ratios')
+def load_ratios():
+    """
+    Liquidity ratios materialized by build_ratios.py, indexed by
+    (gics_sub_industry, period_ending). When the table is missing or older
+    than the source CSVs the ratios are computed in memory instead; run
+    build_ratios.py to refresh it.
+    """
+    return _ratios_cached(data_version(FUNDAMENTALS_CSV, SECURITIES_CSV))
+
+
+def industry_ratios(sub_industry, period_ending):
+    """Ratios of every filing of one sub-industry for one period, by index lookup."""
+    ratios = load_ratios()
+    key = (sub_industry, period_ending)
+    if key not in ratios.index:
+        return ratios.iloc[0:0].reset_index()
+    return ratios.loc[[key]].reset_index()
+
+
+def data_version(*paths):
+    """Hashable token that changes whenever any of the given source files change."""
+    return tuple(file_fingerprint(path) for path in (paths or (FUNDAMENTALS_CSV, PRICES_CSV, SECURITIES_CSV)))
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Process-wide LRU cache of Plotly figures.
+
+Figures are stored as serialized JSON under (page, chart id, widget values,
+data version), so revisiting a page or flipping back to an earlier selectbox
+value skips building the figure and all of its update_layout/update_traces
+calls. The cache is shared by every session and bounded by the total size of
+the stored JSON.
+"""
+
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+from data_loader import data_version
+from profiling import stage
+
+MAX_BYTES = 64 * 1024 * 1024
+
+
+class FigureCache:
+
+    def __init__(self, max_bytes=MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            serialized = self._entries.get(key)
+            if serialized is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return serialized
+
+    def put(self, key, serialized):
+        if len(serialized) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.size -= len(self._entries.pop(key))
+            self._entries[key] = serialized
+            self.size += len(serialized)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def figure(self, page, chart_id, widgets, build, version=None):
+        """
+        The figure for `chart_id` on `page` given the current widget values.
+
+        `build` is only called on a miss. `version` defaults to the fingerprint
+        of the source CSVs, so edited data never serves a stale figure.
+        """
+        key = (page, chart_id, tuple(sorted(widgets.items())), data_version() if version is None else version)
+        with stage(f'figure {chart_id}') as current:
+            serialized = self.get(key)
+            current.note(cache='miss' if serialized is None else 'hit')
+            if serialized is None:
+                with stage('build'):
+                    serialized = build().to_json()
+                self.put(key, serialized)
+            return pio.from_json(serialized, skip_invalid=True)
+
+
+figure_cache = FigureCache()
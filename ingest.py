@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Chunked streaming ingest for price files too large to parse in one go.
+
+The full NYSE price history and vendor dumps are read `chunksize` rows at a
+time. Each chunk is downcast, filtered to the requested symbols and date range,
+and either kept (`load_prices_streaming`) or folded into running per-symbol
+aggregates (`stream_price_aggregates`) and dropped, so peak memory depends on
+the chunk size and the selection, not on the size of the file.
+
+The dashboard loads prices this way when DATAQUEST_STREAM_PRICES=1 is set,
+see data_loader.load_prices().
+"""
+
+import numpy as np
+import pandas as pd
+
+from data_loader import PRICE_DTYPES
+
+DEFAULT_CHUNKSIZE = 250_000
+AGGREGATE_COLUMNS = ['count', 'mean', 'm2', 'first_date', 'first_close', 'last_date', 'last_close']
+
+
+def iter_price_chunks(path, symbols=None, start=None, end=None, columns=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield filtered, downcast chunks of the price CSV at `path`."""
+    usecols = None if columns is None else list(dict.fromkeys(['date', 'symbol', *columns]))
+    dtype = {column: kind for column, kind in PRICE_DTYPES.items() if usecols is None or column in usecols}
+    # Categories differ from chunk to chunk, so symbols are only made categorical once filtered
+    dtype['symbol'] = 'object'
+    symbols = None if symbols is None else set(symbols)
+    start = None if start is None else pd.Timestamp(start)
+    end = None if end is None else pd.Timestamp(end)
+
+    reader = pd.read_csv(path, usecols=usecols, dtype=dtype, parse_dates=['date'], chunksize=chunksize)
+    for chunk in reader:
+        mask = np.ones(len(chunk), dtype=bool)
+        if symbols is not None:
+            mask &= chunk['symbol'].isin(symbols).to_numpy()
+        if start is not None:
+            mask &= (chunk['date'] >= start).to_numpy()
+        if end is not None:
+            mask &= (chunk['date'] <= end).to_numpy()
+        if mask.any():
+            yield chunk[mask]
+
+
+def load_prices_streaming(path, symbols=None, start=None, end=None, columns=None, chunksize=DEFAULT_CHUNKSIZE):
+    """Only the requested rows of a price file, with the same dtypes as data_loader.load_prices()."""
+    chunks = list(iter_price_chunks(path, symbols, start, end, columns, chunksize))
+    if not chunks:
+        names = ['date', 'symbol'] + [column for column in (columns or PRICE_DTYPES) if column not in ('date', 'symbol')]
+        dtypes = dict(PRICE_DTYPES, date='datetime64[ns]')
+        return pd.DataFrame({column: pd.Series(dtype=dtypes.get(column, 'object')) for column in names})
+    prices = pd.concat(chunks, ignore_index=True)
+    prices['symbol'] = prices['symbol'].astype('category')
+    return prices
+
+
+def _chunk_aggregates(chunk):
+    # Missing closes are skipped, as in close_statistics(); a symbol with none left is absent
+    chunk = chunk[chunk['close'].notna()].sort_values(['symbol', 'date'], kind='mergesort')
+    close = chunk['close'].astype('float64')
+    grouped = close.groupby(chunk['symbol'])
+    dates = chunk['date'].groupby(chunk['symbol'])
+    aggregates = pd.DataFrame({
+        'count': grouped.count(),
+        'mean': grouped.mean(),
+        'm2': grouped.var(ddof=0) * grouped.count(),
+        'first_date': dates.first(),
+        'first_close': grouped.first(),
+        'last_date': dates.last(),
+        'last_close': grouped.last(),
+    })
+    return aggregates
+
+
+def _merge_aggregates(running, chunk):
+    """Combine two sets of per-symbol aggregates (Chan et al. parallel variance)."""
+    running, chunk = running.align(chunk, join='outer', axis=0)
+    new = chunk['count'].notna() & running['count'].isna()
+    running.loc[new] = chunk.loc[new]
+    both = chunk['count'].notna() & ~new
+    a, b = running[both], chunk[both]
+
+    count = a['count'] + b['count']
+    delta = b['mean'] - a['mean']
+    running.loc[both, 'mean'] = a['mean'] + delta * b['count'] / count
+    running.loc[both, 'm2'] = a['m2'] + b['m2'] + delta ** 2 * a['count'] * b['count'] / count
+    running.loc[both, 'count'] = count
+
+    earlier = both & (chunk['first_date'] < running['first_date'])
+    running.loc[earlier, ['first_date', 'first_close']] = chunk.loc[earlier, ['first_date', 'first_close']]
+    later = both & (chunk['last_date'] > running['last_date'])
+    running.loc[later, ['last_date', 'last_close']] = chunk.loc[later, ['last_date', 'last_close']]
+    return running
+
+
+def stream_price_aggregates(path, symbols=None, start=None, end=None, chunksize=DEFAULT_CHUNKSIZE):
+    """
+    Per-symbol closing price aggregates of a price file, computed one chunk at a time.
+
+    Returns the same columns as analytics.close_statistics() (count, mean,
+    standard_deviation, first_close, last_close, trend_price) plus the running
+    `sum` and `sum_of_squares` of the close, indexed by ticker symbol. Rows do
+    not have to be sorted by symbol or date.
+    """
+    running = pd.DataFrame(columns=AGGREGATE_COLUMNS)
+    for chunk in iter_price_chunks(path, symbols, start, end, ['close'], chunksize):
+        aggregates = _chunk_aggregates(chunk)
+        running = aggregates if running.empty else _merge_aggregates(running, aggregates)
+
+    count = running['count'].astype('float64')
+    mean = running['mean'].astype('float64')
+    m2 = running['m2'].astype('float64')
+    stats = pd.DataFrame({
+        'count': count.astype('int64'),
+        'mean': mean,
+        'standard_deviation': np.sqrt(m2 / (count - 1)),
+        'first_close': running['first_close'].astype('float64'),
+        'last_close': running['last_close'].astype('float64'),
+    }, index=running.index.astype(str))
+    stats['trend_price'] = (stats['last_close'] - stats['first_close']) / stats['first_close']
+    stats['sum'] = mean * count
+    stats['sum_of_squares'] = m2 + count * mean ** 2
+    stats.index.name = 'ticker_symbol'
+    if symbols is not None:
+        stats = stats.reindex([symbol for symbol in symbols if symbol in stats.index])
+    return stats
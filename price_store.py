@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Symbol-partitioned price store.
+
+Prices are sorted once by (symbol, date) so that each ticker occupies one
+contiguous block of rows. A symbol -> row range index plus a binary search over
+the datetime64 dates turns "ticker X between dates A and B" into a positional
+slice, instead of a boolean mask over the whole table.
+
+Cumulative sums of the close, close squared and daily log returns are also
+precomputed once, so the mean, variance and return of any symbol over any date
+window are O(1) differences of two prefix sums, and rolling volatilities come
+out of a single vectorized pass. Missing or non-positive closes are left out of
+every sum and count, as groupby aggregations skip NaN, and a day's return is
+taken against the symbol's previous valid close.
+"""
+
+import numpy as np
+import pandas as pd
+
+TRADING_DAYS = 252
+ROLLING_WINDOWS = (20, 60, 252)
+
+
+class PriceStore:
+
+    def __init__(self, prices):
+        frame = prices.sort_values(['symbol', 'date'], kind='mergesort').reset_index(drop=True)
+        symbols = frame['symbol']
+        if hasattr(symbols, 'cat'):
+            codes, labels = symbols.cat.codes.to_numpy(), symbols.cat.categories
+        else:
+            codes, labels = pd.factorize(symbols, sort=True)
+
+        # Row positions where a new symbol block starts
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]]) if len(codes) else np.array([], dtype=int)
+        stops = np.r_[starts[1:], len(codes)]
+
+        self.frame = frame
+        self.dates = frame['date'].to_numpy()
+        self.ranges = {str(labels[codes[start]]): (int(start), int(stop)) for start, stop in zip(starts, stops)}
+        self._precompute(starts, stops)
+
+    def _precompute(self, starts, stops):
+        n = len(self.frame)
+        lengths = stops - starts
+        block = np.repeat(np.arange(len(starts)), lengths)
+        self.block_starts = np.repeat(starts, lengths)
+        self._block_index = {symbol: i for i, symbol in enumerate(self.ranges)}
+
+        # Composite (symbol block, day) key sorted like the frame, for vectorized range lookups
+        days = self.dates.astype('datetime64[D]').astype('int64')
+        self._day_origin = days.min() if n else 0
+        self._keys = (block.astype('int64') << 32) + (days - self._day_origin)
+
+        close = self.frame['close'].to_numpy(dtype='float64')
+        with np.errstate(invalid='ignore'):
+            valid = np.isfinite(close) & (close > 0)
+        self._close = close
+        self._cum_valid = np.r_[0, np.cumsum(valid)]
+
+        # Nearest valid row at or after / at or before each row (n / -1 when there is none)
+        positions = np.arange(n)
+        self._next_valid = np.r_[np.minimum.accumulate(np.where(valid, positions, n)[::-1])[::-1], n]
+        self._prev_valid = np.maximum.accumulate(np.where(valid, positions, -1)) if n else positions
+
+        # Prices are shifted by each symbol's first valid close before summing, which
+        # keeps the sum-of-squares variance formula numerically stable
+        first_valid = self._next_valid[starts] if n else starts
+        first_close = np.where(first_valid < stops, close[np.minimum(first_valid, max(n - 1, 0))], 0.0)
+        self._shift = np.repeat(first_close, lengths)
+        shifted = np.where(valid, close - self._shift, 0.0)
+        self._cum_close = np.r_[0.0, np.cumsum(shifted)]
+        self._cum_close_sq = np.r_[0.0, np.cumsum(shifted ** 2)]
+
+        # Log return of each valid row against the previous valid close of the same
+        # symbol; NaN on invalid rows and on each symbol's first valid row
+        previous = np.r_[-1, self._prev_valid[:-1]] if n else positions
+        has_return = valid & (previous >= self.block_starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            log_close = np.log(np.where(valid, close, np.nan))
+        returns = np.full(n, np.nan)
+        returns[has_return] = log_close[has_return] - log_close[previous[has_return]]
+        self._returns = returns
+        filled = np.where(has_return, returns, 0.0)
+        self._cum_has_return = np.r_[0, np.cumsum(has_return)]
+        self._cum_return = np.r_[0.0, np.cumsum(filled)]
+        self._cum_return_sq = np.r_[0.0, np.cumsum(filled ** 2)]
+
+    def __contains__(self, symbol):
+        return symbol in self.ranges
+
+    @property
+    def symbols(self):
+        return list(self.ranges)
+
+    def row_range(self, symbol, start=None, end=None):
+        """Positional [lo, hi) rows of `symbol` with start <= date <= end."""
+        lo, hi = self.ranges[symbol]
+        dates = self.dates[lo:hi]
+        if start is not None:
+            lo_offset = np.searchsorted(dates, np.datetime64(pd.Timestamp(start)), side='left')
+        else:
+            lo_offset = 0
+        if end is not None:
+            hi_offset = np.searchsorted(dates, np.datetime64(pd.Timestamp(end)), side='right')
+        else:
+            hi_offset = hi - lo
+        return lo + int(lo_offset), lo + int(hi_offset)
+
+    def slice(self, symbol, start=None, end=None):
+        """Prices of one ticker between two dates (inclusive), as a view of the store."""
+        lo, hi = self.row_range(symbol, start, end)
+        return self.frame.iloc[lo:hi]
+
+    def window(self, symbols=None, start=None, end=None):
+        """Prices of several tickers between two dates, in the order the tickers are given."""
+        symbols = self.symbols if symbols is None else [symbol for symbol in symbols if symbol in self.ranges]
+        if not symbols:
+            return self.frame.iloc[0:0]
+        return pd.concat([self.slice(symbol, start, end) for symbol in symbols])
+
+    def _day_offset(self, value):
+        return int(np.datetime64(pd.Timestamp(value), 'D').astype('int64')) - int(self._day_origin)
+
+    def row_ranges(self, symbols=None, start=None, end=None):
+        """Vectorized `row_range` for many symbols: arrays of lo and hi row positions."""
+        symbols = self.symbols if symbols is None else [symbol for symbol in symbols if symbol in self.ranges]
+        blocks = np.array([self._block_index[symbol] for symbol in symbols], dtype='int64') << 32
+        limit = (1 << 32) - 1
+        first = 0 if start is None else self._day_offset(start)
+        last = limit if end is None else self._day_offset(end)
+        lo = np.searchsorted(self._keys, blocks + min(max(first, 0), limit), side='left')
+        hi = np.searchsorted(self._keys, blocks + min(last, limit), side='right') if last >= 0 else lo
+        return symbols, lo, np.maximum(hi, lo)
+
+    def window_statistics(self, symbols=None, start=None, end=None):
+        """
+        Per-symbol closing price statistics over [start, end] from the prefix sums.
+
+        Same columns as analytics.close_statistics(), plus the total log return and
+        the annualized volatility of daily log returns over the window.
+        """
+        symbols, lo, hi = self.row_ranges(symbols, start, end)
+        count = (self._cum_valid[hi] - self._cum_valid[lo]).astype('float64')
+        total = self._cum_close[hi] - self._cum_close[lo]
+        total_sq = self._cum_close_sq[hi] - self._cum_close_sq[lo]
+        last_row = max(len(self._close) - 1, 0)
+        shift = self._shift[np.minimum(lo, last_row)] if len(self._shift) else np.zeros(len(lo))
+        first_row = self._next_valid[lo]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variance = (total_sq - total ** 2 / count) / (count - 1)
+            first_close = np.where(count > 0, self._close[np.minimum(first_row, last_row)], np.nan)
+            last_close = np.where(count > 0, self._close[self._prev_valid[np.maximum(hi - 1, 0)]], np.nan)
+
+            # Returns inside the window start after its first valid close
+            return_lo = np.minimum(first_row + 1, hi)
+            return_count = (self._cum_has_return[hi] - self._cum_has_return[return_lo]).astype('float64')
+            returns = self._cum_return[hi] - self._cum_return[return_lo]
+            returns_sq = self._cum_return_sq[hi] - self._cum_return_sq[return_lo]
+            return_variance = (returns_sq - returns ** 2 / return_count) / (return_count - 1)
+
+            stats = pd.DataFrame({
+                'count': count.astype('int64'),
+                'mean': shift + total / count,
+                'standard_deviation': np.where(count > 1, np.sqrt(np.maximum(variance, 0)), np.nan),
+                'first_close': first_close,
+                'last_close': last_close,
+                'trend_price': (last_close - first_close) / first_close,
+                'log_return': np.where(count > 0, returns, np.nan),
+                'return_volatility': np.where(return_count > 1, np.sqrt(np.maximum(return_variance, 0) * TRADING_DAYS),
+                                             np.nan),
+            }, index=pd.Index(symbols, name='ticker_symbol'))
+        return stats
+
+    def returns_matrix(self, symbols=None, start=None, end=None):
+        """
+        Daily log returns aligned on one date axis: (dates, symbols, T x N float64 array).
+
+        A row's return is taken against the previous valid close of the same
+        symbol, so the first day of the window keeps its return; days a symbol
+        did not trade or has no valid close, and its first day in the store, are NaN.
+        """
+        symbols, lo, hi = self.row_ranges(symbols, start, end)
+        lengths = hi - lo
+        rows = np.concatenate([np.arange(a, b) for a, b in zip(lo, hi)]) if len(lo) else np.array([], dtype=int)
+        dates = np.unique(self.dates[rows])
+        matrix = np.full((len(dates), len(symbols)), np.nan)
+        if len(rows):
+            matrix[np.searchsorted(dates, self.dates[rows]), np.repeat(np.arange(len(symbols)), lengths)] = self._returns[rows]
+        return dates, symbols, matrix
+
+    def rolling_volatility(self, windows=ROLLING_WINDOWS, symbols=None, start=None, end=None):
+        """
+        Annualized rolling volatility of daily log returns for each window length.
+
+        Returns a (date, symbol) long frame with one `volatility_<window>d` column per
+        window; rows without a full window of history for their symbol, or
+        without a valid close, are NaN. Missing closes inside a window shorten it.
+        """
+        symbols, lo, hi = self.row_ranges(symbols, start, end)
+        rows = np.concatenate([np.arange(a, b) for a, b in zip(lo, hi)]) if len(lo) else np.array([], dtype=int)
+        result = self.frame.iloc[rows][['date', 'symbol']].reset_index(drop=True)
+        # Window of w returns ending at row i spans rows i-w+1..i and needs row i-w of the same symbol
+        for window in windows:
+            begin = rows - window + 1
+            valid = begin - 1 >= self.block_starts[rows]
+            begin = np.where(valid, begin, rows)
+            count = (self._cum_has_return[rows + 1] - self._cum_has_return[begin]).astype('float64')
+            valid &= ~np.isnan(self._returns[rows]) & (count >= 2)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                total = self._cum_return[rows + 1] - self._cum_return[begin]
+                total_sq = self._cum_return_sq[rows + 1] - self._cum_return_sq[begin]
+                variance = (total_sq - total ** 2 / count) / (count - 1)
+            result[f'volatility_{window}d'] = np.where(valid, np.sqrt(np.maximum(variance, 0) * TRADING_DAYS), np.nan)
+        return result
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Opt-in timing and memory instrumentation of each script rerun.
+
+Set DATAQUEST_PROFILE=1 in the environment (every session) or open the app
+with ?profile=1 (one session) to record each stage of a rerun: wall time,
+memory allocated while it ran (via tracemalloc) and the size of the
+DataFrames it produced. The stages are shown in a collapsible diagnostics
+panel at the bottom of the page and logged as one JSON line per rerun on the
+'dataquest.profile' logger. With profile=cprofile or profile=pyinstrument the
+rerun is also run under that profiler and its report added to the panel.
+
+tracemalloc and the profilers are process-wide, and Streamlit serves every
+session from a thread of the same process. So only one rerun at a time gets
+memory figures and a profiler report; reruns profiled concurrently in other
+sessions record timings and DataFrame sizes only. The memory figures still
+include whatever other, unprofiled sessions allocate meanwhile.
+
+With profiling off, stage() and timed() cost one thread-local lookup.
+"""
+
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+ENV_VAR = 'DATAQUEST_PROFILE'
+QUERY_PARAM = 'profile'
+PROFILERS = ('cprofile', 'pyinstrument')
+HISTORY = 20
+
+logger = logging.getLogger('dataquest.profile')
+if not logger.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# Streamlit runs each session's script in its own thread
+_local = threading.local()
+# Held by the one rerun that runs tracemalloc and the profiler
+_memory_lock = threading.Lock()
+
+
+class Stage:
+    """One timed stage of a rerun, nested `depth` stages deep."""
+
+    def __init__(self, name, depth):
+        self.name = name
+        self.depth = depth
+        self.seconds = 0.0
+        self.allocated = None
+        self.peak = None
+        self.rows = None
+        self.frame_bytes = None
+        self.notes = {}
+        self._start_memory = 0
+
+    def record(self, result):
+        """Add the rows and in-memory size of any DataFrames in `result`."""
+        for frame in _frames(result):
+            self.rows = (self.rows or 0) + len(frame)
+            self.frame_bytes = (self.frame_bytes or 0) + int(frame.memory_usage(deep=True).sum())
+        return result
+
+    def note(self, **notes):
+        self.notes.update(notes)
+
+    def as_dict(self):
+        return {'stage': self.name, 'depth': self.depth, 'seconds': round(self.seconds, 6),
+                'allocated_bytes': self.allocated, 'peak_bytes': self.peak,
+                'rows': self.rows, 'frame_bytes': self.frame_bytes, **self.notes}
+
+
+class _NullStage:
+
+    def record(self, result):
+        return result
+
+    def note(self, **notes):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Rerun:
+    """Stages recorded during one rerun of one page."""
+
+    def __init__(self, page, mode, memory):
+        self.page = page
+        self.mode = mode
+        self.memory = memory
+        self.stages = []
+        self.open = []
+        self.seconds = 0.0
+        self.profiler = None
+        self.report = None
+
+    def as_dict(self):
+        return {'event': 'rerun', 'page': self.page, 'seconds': round(self.seconds, 6),
+                'memory': 'process-wide' if self.memory else None, 'profiler': self.profiler,
+                'stages': [stage.as_dict() for stage in self.stages]}
+
+
+def _frames(result):
+    if isinstance(result, (tuple, list)):
+        return [frame for item in result for frame in _frames(item)]
+    if hasattr(result, 'memory_usage') and hasattr(result, '__len__'):
+        return [result]
+    # PriceStore and other wrappers around one frame
+    frame = getattr(result, 'frame', None)
+    return [frame] if hasattr(frame, 'memory_usage') else []
+
+
+def _fold_peak(stages):
+    """Credit the peak traced memory since the last fold to every open stage, then reset it."""
+    current, peak = tracemalloc.get_traced_memory()
+    for stage in stages:
+        stage.peak = max(stage.peak, peak - stage._start_memory)
+    tracemalloc.reset_peak()
+
+
+def active():
+    return getattr(_local, 'rerun', None)
+
+
+@contextmanager
+def stage(name):
+    """Time the enclosed block as a stage of the current rerun; yields a Stage to record() results on."""
+    rerun = active()
+    if rerun is None:
+        yield _NULL_STAGE
+        return
+    current = Stage(name, len(rerun.open))
+    if rerun.memory:
+        _fold_peak(rerun.open)
+        current.peak = 0
+        current._start_memory = tracemalloc.get_traced_memory()[0]
+    rerun.stages.append(current)
+    rerun.open.append(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.seconds = time.perf_counter() - started
+        if rerun.memory:
+            _fold_peak(rerun.open)
+            current.allocated = tracemalloc.get_traced_memory()[0] - current._start_memory
+        rerun.open.pop()
+
+
+def timed(name):
+    """Decorator: run the function as a stage and record the DataFrames it returns."""
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if active() is None:
+                return function(*args, **kwargs)
+            with stage(name) as current:
+                return current.record(function(*args, **kwargs))
+        return wrapper
+    return decorator
+
+
+def requested_mode():
+    """'' when profiling is off, otherwise '1' or the name of a profiler, from the query string or environment."""
+    import streamlit as st
+
+    if hasattr(st, 'experimental_get_query_params'):
+        value = st.experimental_get_query_params().get(QUERY_PARAM, [''])[0]
+    else:
+        value = st.query_params.get(QUERY_PARAM, '')
+    return (value or os.environ.get(ENV_VAR, '')).strip().lower()
+
+
+@contextmanager
+def _profiler(mode):
+    """
+    Run the block under cProfile or pyinstrument; yields (name of the profiler
+    that actually ran, callable returning its text report).
+    """
+    if mode == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            logger.warning(json.dumps({'event': 'profiler_unavailable', 'profiler': mode, 'fallback': 'cprofile'}))
+        else:
+            profiler = Profiler()
+            profiler.start()
+            try:
+                yield 'pyinstrument', lambda: profiler.output_text(unicode=True)
+            finally:
+                profiler.stop()
+            return
+    profiler = cProfile.Profile()
+
+    def report():
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(40)
+        return out.getvalue()
+
+    try:
+        profiler.enable()
+    except ValueError:
+        # Python 3.12+ allows one profiler at a time per process, e.g. a debugger's
+        yield None, lambda: 'Not profiled: another profiler is already running.'
+        return
+    try:
+        yield 'cprofile', report
+    finally:
+        profiler.disable()
+
+
+@contextmanager
+def rerun(page):
+    """
+    Record one rerun of `page` when profiling is requested, then log it and
+    show the diagnostics panel. Does nothing otherwise.
+    """
+    mode = requested_mode()
+    if not mode or mode in ('0', 'false', 'off'):
+        yield
+        return
+
+    exclusive = _memory_lock.acquire(blocking=False)
+    current = Rerun(page, mode, memory=exclusive)
+    _local.rerun = current
+    # Leave tracing alone if the process was started with -X tracemalloc
+    own_tracing = exclusive and not tracemalloc.is_tracing()
+    if own_tracing:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        if exclusive and mode in PROFILERS:
+            with _profiler(mode) as (current.profiler, report):
+                yield
+            current.report = report()
+        else:
+            yield
+    finally:
+        current.seconds = time.perf_counter() - started
+        _local.rerun = None
+        if own_tracing:
+            tracemalloc.stop()
+        if exclusive:
+            _memory_lock.release()
+        logger.info(json.dumps(current.as_dict(), default=str))
+    diagnostics_panel(current)
+
+
+def diagnostics_panel(current):
+    """Stages of this rerun, and the last reruns of every page in this session."""
+    import streamlit as st
+
+    history = st.session_state.setdefault('profile_history', [])
+    history.append({'page': current.page, 'seconds': round(current.seconds, 6),
+                    'stages': len(current.stages),
+                    'peak_bytes': max((stage.peak for stage in current.stages), default=None) if current.memory else None})
+    del history[:-HISTORY]
+
+    with st.expander(f'Diagnostics: {current.page} rendered in {current.seconds * 1000:.1f} ms'):
+        st.markdown('**This rerun**')
+        rows = [dict(stage.as_dict(), stage='\u2003' * stage.depth + stage.name) for stage in current.stages]
+        st.table(rows or [{'stage': '(no stages recorded)'}])
+        if current.memory:
+            st.caption('Memory columns are process-wide: they include allocations made by other sessions during this rerun.')
+        else:
+            st.caption('Memory was not traced and no profiler ran: another session\'s rerun was being profiled.')
+        st.markdown('**Recent reruns in this session**')
+        st.table(history)
+        if current.report is not None:
+            st.markdown(f'**{current.profiler or current.mode} report**')
+            st.text(current.report)
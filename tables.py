@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Server-side paginated tables.
+
+`st.write(frame)` serializes the whole frame to the browser on every rerun.
+`paginated_table` instead filters, sorts and projects the cached frame on the
+server and only sends the rows of the current page. The filtered and sorted
+row order is kept per table in the session, so paging through a table does not
+filter or sort it again.
+"""
+
+import weakref
+
+import numpy as np
+import streamlit as st
+
+PAGE_SIZES = (25, 50, 100, 250)
+
+
+def row_order(frame, sort_by=None, ascending=True, filter_column=None, query=''):
+    """Positions of the rows of `frame` that match `query`, in display order."""
+    positions = np.arange(len(frame))
+    if query and filter_column is not None:
+        values = frame[filter_column].astype(str)
+        positions = np.flatnonzero(values.str.contains(query, case=False, regex=False).to_numpy())
+
+    if sort_by is not None:
+        keys = frame[sort_by].iloc[positions].reset_index(drop=True)
+        order = keys.sort_values(ascending=ascending, na_position='last', kind='mergesort').index.to_numpy()
+        positions = positions[order]
+    return positions
+
+
+def paginate(frame, page=1, page_size=PAGE_SIZES[0], sort_by=None, ascending=True,
+             filter_column=None, query='', columns=None, positions=None):
+    """
+    One page of `frame` after filtering, sorting and column projection.
+
+    `query` is a case-insensitive substring matched against `filter_column`.
+    `positions` is a precomputed row_order() for the same arguments.
+    Returns (page rows, number of matching rows, number of pages).
+    """
+    if positions is None:
+        positions = row_order(frame, sort_by, ascending, filter_column, query)
+
+    total = len(positions)
+    pages = max(1, -(-total // page_size))
+    page = min(max(1, page), pages)
+    rows = positions[(page - 1) * page_size:page * page_size]
+    # Only the visible slice is materialized
+    visible = frame.iloc[rows]
+    if columns is not None:
+        visible = visible[list(columns)]
+    return visible, total, pages
+
+
+def paginated_table(frame, key, page_size=PAGE_SIZES[0]):
+    """Render `frame` one page at a time with sort, filter and column pickers."""
+    all_columns = [str(column) for column in frame.columns]
+    with st.expander('Table options'):
+        col1, col2, col3 = st.columns(3)
+        sort_by = col1.selectbox('Sort by', ['(original order)'] + all_columns, key=f'{key}_sort')
+        descending = col1.checkbox('Descending', key=f'{key}_descending')
+        filter_column = col2.selectbox('Filter column', all_columns, key=f'{key}_filter_column')
+        query = col2.text_input('Contains', key=f'{key}_query')
+        page_size = col3.selectbox('Rows per page', PAGE_SIZES, index=PAGE_SIZES.index(page_size), key=f'{key}_page_size')
+        columns = st.multiselect('Columns', all_columns, default=all_columns, key=f'{key}_columns')
+
+    page_key = f'{key}_page'
+    order = {'sort_by': None if sort_by == '(original order)' else sort_by, 'ascending': not descending,
+             'filter_column': filter_column, 'query': query}
+    # Reused while the same frame object is shown with the same filter and sort
+    cached = st.session_state.get(f'{key}_order')
+    if cached is not None and cached[0]() is frame and cached[1] == order:
+        positions = cached[2]
+    else:
+        positions = row_order(frame, **order)
+        st.session_state[f'{key}_order'] = (weakref.ref(frame), order, positions)
+    visible, total, pages = paginate(frame, st.session_state.get(page_key, 1), page_size, columns=columns,
+                                     positions=positions, **order)
+    if columns:
+        st.dataframe(visible)
+    else:
+        st.info('No columns selected. Pick at least one under Table options.')
+
+    # A narrower filter can leave the stored page past the last one
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = st.session_state.get(page_key, 1)
+    col1, col2 = st.columns([1, 4])
+    col1.number_input('Page', min_value=1, max_value=pages, step=1, key=page_key)
+    first = (page - 1) * page_size + 1 if total else 0
+    last = first + len(visible) - 1 if total else 0
+    col2.caption(f'Rows {first:,}–{last:,} of {total:,} ({pages:,} pages)')
@@ -0,0 +1,68 @@
+"""Regression tests pinning the airline numbers shown on the Data Analysis page."""
+
+import pandas as pd
+import pytest
+
+import analytics
+import data_loader
+from price_store import PriceStore
+
+AIRLINES = ['AAL', 'ALK', 'DAL', 'LUV', 'UAL']
+STANDARD_DEVIATIONS = [15.437005, 16.078078, 14.594517, 12.168415, 15.537090]
+CURRENT_RATIOS = [0.733921, 0.920819, 0.516718, 0.543343, 0.630578]
+CASH_RATIOS = [51.0, 74.0, 31.0, 41.0, 42.0]
+# Trend price of each ticker's first and last 2010-2015 close over that of the
+# equally weighted airline group, which replaced the old iloc row offsets
+RPS = [2.961872, 0.492064, 1.322520, 1.072024, 1.307007]
+
+
+@pytest.fixture(scope='module')
+def filings_2015():
+    combined = data_loader.load_combined()
+    return combined[combined['period_ending'] == '2015-12-31']
+
+
+@pytest.fixture(scope='module')
+def airline_symbols(filings_2015):
+    return analytics.select_symbols(filings_2015, sub_industry='Airlines')
+
+
+@pytest.fixture(scope='module')
+def stats(airline_symbols):
+    return analytics.close_statistics(data_loader.load_prices(), airline_symbols, end='2015-12-31')
+
+
+def test_select_symbols_by_sub_industry(airline_symbols):
+    assert airline_symbols == AIRLINES
+
+
+def test_standard_deviations(stats):
+    assert stats.index.tolist() == AIRLINES
+    assert stats['standard_deviation'].tolist() == pytest.approx(STANDARD_DEVIATIONS, abs=1e-6)
+
+
+def test_price_store_matches_close_statistics(stats):
+    store = PriceStore(data_loader.load_prices())
+    window = store.window_statistics(AIRLINES, end='2015-12-31')
+    assert window['standard_deviation'].tolist() == pytest.approx(STANDARD_DEVIATIONS, abs=1e-6)
+    columns = ['count', 'mean', 'first_close', 'last_close', 'trend_price']
+    pd.testing.assert_frame_equal(window[columns], stats[columns], check_dtype=False, rtol=1e-6)
+
+
+def test_relative_price_strength(stats):
+    assert analytics.relative_price_strength(stats).tolist() == pytest.approx(RPS, abs=1e-6)
+    first, last = stats['first_close'].mean(), stats['last_close'].mean()
+    assert analytics.benchmark_trend_price(stats) == pytest.approx((last - first) / first)
+
+
+def test_relative_price_strength_against_benchmark_group(stats):
+    rps = analytics.relative_price_strength(stats, benchmark=['DAL'])
+    assert rps['DAL'] == pytest.approx(1.0)
+
+
+def test_liquidity_ratios(filings_2015):
+    ratios = analytics.liquidity_ratios(filings_2015)
+    airlines = ratios[ratios['gics_sub_industry'] == 'Airlines'].set_index('ticker_symbol').loc[AIRLINES]
+    assert airlines['current_ratio'].tolist() == pytest.approx(CURRENT_RATIOS, abs=1e-6)
+    assert airlines['cash_ratio'].tolist() == CASH_RATIOS
+    assert airlines['current_ratio_industry_average'].unique() == pytest.approx([0.669076], abs=1e-6)
@@ -0,0 +1,54 @@
+"""Streaming ingest against the in-memory loader and analytics.close_statistics."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+import data_loader
+from ingest import load_prices_streaming, stream_price_aggregates
+
+COLUMNS = ['count', 'mean', 'standard_deviation', 'first_close', 'last_close', 'trend_price']
+
+
+@pytest.fixture(scope='module', params=['sorted', 'shuffled'])
+def dirty_csv(request, tmp_path_factory):
+    """prices1.csv with AAL's closes before 2010-06-01 and a scattering of others blanked."""
+    prices = pd.read_csv(data_loader.PRICES_CSV)
+    prices.loc[(prices['symbol'] == 'AAL') & (prices['date'] < '2010-06-01'), 'close'] = np.nan
+    prices.loc[prices.sample(frac=0.02, random_state=0).index, 'close'] = np.nan
+    path = tmp_path_factory.mktemp('prices') / 'prices.csv'
+    if request.param == 'shuffled':
+        prices = prices.sample(frac=1, random_state=1)
+    prices.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.mark.parametrize('chunksize', [200, 1000, 100_000])
+def test_stream_aggregates_match_close_statistics(dirty_csv, chunksize):
+    expected = analytics.close_statistics(data_loader.parse_prices(dirty_csv))
+    result = stream_price_aggregates(dirty_csv, chunksize=chunksize)
+    assert result.loc['AAL', COLUMNS].notna().all()
+    pd.testing.assert_frame_equal(result[COLUMNS], expected[COLUMNS].loc[result.index], check_dtype=False, rtol=1e-6)
+
+
+def test_stream_aggregates_with_filter(dirty_csv):
+    expected = analytics.close_statistics(data_loader.parse_prices(dirty_csv), ['DAL', 'AAL'], '2012-01-01', '2013-06-30')
+    result = stream_price_aggregates(dirty_csv, ['DAL', 'AAL'], '2012-01-01', '2013-06-30', chunksize=300)
+    pd.testing.assert_frame_equal(result[COLUMNS], expected[COLUMNS], check_dtype=False, rtol=1e-6)
+
+
+def test_load_prices_streaming_matches_loader(dirty_csv):
+    full = data_loader.parse_prices(dirty_csv)
+    streamed = load_prices_streaming(dirty_csv, ['LUV'], '2011-01-01', '2011-12-31', chunksize=250)
+    expected = full[(full['symbol'] == 'LUV') & full['date'].between('2011-01-01', '2011-12-31')]
+    assert streamed.dtypes.drop('symbol').equals(full.dtypes.drop('symbol'))
+    pd.testing.assert_frame_equal(streamed.reset_index(drop=True), expected.reset_index(drop=True),
+                                  check_categorical=False)
+
+
+def test_load_prices_streaming_no_match_keeps_dtypes(dirty_csv):
+    empty = load_prices_streaming(dirty_csv, ['XYZ'])
+    assert len(empty) == 0
+    assert empty['close'].dtype == 'float32'
+    assert pd.api.types.is_datetime64_any_dtype(empty['date'])
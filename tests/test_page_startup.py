@@ -0,0 +1,34 @@
+"""Cold-start render of every page against its budget in benchmarks/page_startup.py."""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(REPO_DIR, 'benchmarks', 'page_startup.py')
+
+_spec = importlib.util.spec_from_file_location('page_startup', SCRIPT)
+page_startup = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(page_startup)
+
+# Text-only pages must not pull in the data or charting stack
+TEXT_PAGES = ['Abstract', 'Bibliography']
+
+
+def render_in_fresh_process(title):
+    output = subprocess.run([sys.executable, SCRIPT, '--worker', title], cwd=REPO_DIR,
+                            check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize('title', list(page_startup.BUDGETS))
+def test_page_renders_within_budget(title):
+    result = render_in_fresh_process(title)
+    assert result['error'] is None or result['offline'], result['error']
+    assert result['seconds'] <= page_startup.BUDGETS[title]
+    if title in TEXT_PAGES:
+        assert not {'pandas', 'plotly'} & set(result['heavy_modules'])
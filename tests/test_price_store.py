@@ -0,0 +1,76 @@
+"""PriceStore window queries against the groupby reference in analytics.py."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+import data_loader
+from price_store import PriceStore
+
+AIRLINES = ['AAL', 'ALK', 'DAL', 'LUV', 'UAL']
+COLUMNS = ['count', 'mean', 'standard_deviation', 'first_close', 'last_close', 'trend_price']
+
+
+@pytest.fixture(scope='module')
+def dirty_prices():
+    """Prices with a missing, a zero and an infinite close, and a NaN first close."""
+    prices = data_loader.load_prices().copy()
+    for symbol, date, value in [('AAL', '2011-06-01', np.nan), ('DAL', '2011-03-01', 0.0),
+                                ('LUV', '2011-09-01', np.inf), ('ALK', '2010-01-04', np.nan)]:
+        row = (prices['symbol'] == symbol) & (prices['date'] == date)
+        assert row.sum() == 1
+        prices.loc[row, 'close'] = value
+    return prices
+
+
+@pytest.mark.parametrize('start, end', [(None, '2015-12-31'), ('2011-01-01', '2012-01-01'), ('2010-01-04', '2010-02-01')])
+def test_window_statistics_skip_invalid_closes(dirty_prices, start, end):
+    store = PriceStore(dirty_prices)
+    # close_statistics skips NaN; zero and infinite closes are invalid too
+    reference = dirty_prices.assign(close=dirty_prices['close'].where(lambda close: np.isfinite(close) & (close > 0)))
+    expected = analytics.close_statistics(reference, AIRLINES, start, end)
+    result = store.window_statistics(AIRLINES, start, end)
+    assert result[COLUMNS].notna().all().all()
+    pd.testing.assert_frame_equal(result[COLUMNS], expected[COLUMNS], check_dtype=False, rtol=1e-6)
+
+
+def test_window_statistics_of_one_and_two_days():
+    store = PriceStore(data_loader.load_prices())
+    one_day = store.window_statistics(AIRLINES, '2012-03-05', '2012-03-05')
+    assert (one_day['count'] == 1).all()
+    assert one_day['mean'].notna().all()
+    assert one_day['standard_deviation'].isna().all()
+    assert one_day['return_volatility'].isna().all()
+
+    two_days = store.window_statistics(AIRLINES, '2012-03-05', '2012-03-06')
+    assert (two_days['count'] == 2).all()
+    assert two_days['standard_deviation'].notna().all()
+    assert two_days['return_volatility'].isna().all()
+
+
+def test_clean_symbols_unaffected_by_dirty_neighbours(dirty_prices):
+    clean = PriceStore(data_loader.load_prices()).window_statistics(['UAL'], '2011-01-01', '2012-01-01')
+    dirty = PriceStore(dirty_prices).window_statistics(['UAL'], '2011-01-01', '2012-01-01')
+    pd.testing.assert_frame_equal(clean, dirty)
+
+
+def test_returns_skip_invalid_closes(dirty_prices):
+    store = PriceStore(dirty_prices)
+    window = store.window_statistics(['AAL'], '2011-01-01', '2012-01-01')
+    closes = store.slice('AAL', '2011-01-01', '2012-01-01')['close'].dropna().astype('float64')
+    assert window['log_return'].iloc[0] == pytest.approx(np.log(closes.iloc[-1] / closes.iloc[0]))
+
+    dates, symbols, returns = store.returns_matrix(AIRLINES, '2011-01-01', '2012-01-01')
+    assert np.isnan(returns[dates == np.datetime64('2011-06-01'), symbols.index('AAL')]).all()
+    assert np.isfinite(returns[:, symbols.index('UAL')]).all()
+
+
+def test_rolling_volatility_with_invalid_closes(dirty_prices):
+    rolling = PriceStore(dirty_prices).rolling_volatility((20,), AIRLINES)
+    by_symbol = rolling.groupby(rolling['symbol'].astype(str), observed=True)['volatility_20d']
+    assert (by_symbol.count() > 1500).all()
+
+    clean = PriceStore(data_loader.load_prices()).rolling_volatility((20,), ['UAL'])
+    ual = rolling[rolling['symbol'] == 'UAL'].reset_index(drop=True)
+    np.testing.assert_allclose(ual['volatility_20d'], clean['volatility_20d'], rtol=1e-9)